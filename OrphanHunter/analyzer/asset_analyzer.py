@@ -1,7 +1,7 @@
 """Analyzer for orphaned assets (JS, TS, JSON, CSS files)."""
 import re
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Optional, Tuple
 from OrphanHunter.scanner.file_scanner import FileScanner
 import chardet
 
@@ -29,6 +29,8 @@ class AssetAnalyzer:
         
         self.asset_references: Dict[str, Set[str]] = {}  # asset -> pages that reference it
         self.orphaned_assets: Dict[str, Set[str]] = {}  # extension -> orphaned files
+        self._summary_cache: Optional[Dict] = None
+        self._summary_stats = None  # scanner stats the cached summary was built from
     
     def read_file_safe(self, file_path: Path) -> str:
         """Safely read file with encoding detection."""
@@ -87,6 +89,7 @@ class AssetAnalyzer:
                     asset_ext = Path(normalized).suffix.lower()
                     if asset_ext in self.asset_extensions:
                         found_assets.add(normalized)
+                        self._summary_cache = None
                         
                         if normalized not in self.asset_references:
                             self.asset_references[normalized] = set()
@@ -97,6 +100,7 @@ class AssetAnalyzer:
         # Reset
         self.asset_references.clear()
         self.orphaned_assets.clear()
+        self._summary_cache = None
         
         # Scan all page files for asset references
         for file_key, file_info in self.file_scanner.files.items():
@@ -127,17 +131,21 @@ class AssetAnalyzer:
         return self.orphaned_assets
     
     def get_asset_summary(self) -> Dict:
-        """Get summary of asset analysis."""
-        total_assets = sum(
-            1 for f in self.file_scanner.files.values()
-            if f.extension in self.asset_extensions
-        )
+        """Get summary of asset analysis, cached until the analysis or file set changes."""
+        # The scanner rebuilds its stats mapping whenever files are added or removed
+        scanner_stats = self.file_scanner.stats
+        if self._summary_cache is not None and self._summary_stats is scanner_stats:
+            return self._summary_cache
+        
+        ext_counts = scanner_stats['ext_counts']
+        total_assets = sum(ext_counts.get(ext, 0) for ext in self.asset_extensions)
         
         total_orphaned = sum(len(files) for files in self.orphaned_assets.values())
         
         referenced_assets = len(self.asset_references)
         
-        return {
+        self._summary_stats = scanner_stats
+        self._summary_cache = {
             'total_assets': total_assets,
             'referenced_assets': referenced_assets,
             'orphaned_assets': total_orphaned,
@@ -147,6 +155,7 @@ class AssetAnalyzer:
             },
             'orphaned_files': self.orphaned_assets
         }
+        return self._summary_cache
     
     def get_asset_references(self, asset_key: str) -> Set[str]:
         """Get pages that reference a specific asset."""
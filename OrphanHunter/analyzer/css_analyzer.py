@@ -1,7 +1,10 @@
 """CSS analyzer for style conflicts and overlapping rules."""
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Tuple, Optional
 from collections import defaultdict
 import chardet
 
@@ -19,6 +22,12 @@ class CSSRule:
         return f"CSSRule({self.selector} in {self.file}:{self.line})"
 
 
+def _parse_css_one(task) -> Tuple[str, List[CSSRule]]:
+    """Parse one CSS file in a worker process."""
+    root_dir, file_key, file_path = task
+    return file_key, CSSAnalyzer(root_dir).parse_css_file(file_path, file_key)
+
+
 class CSSAnalyzer:
     """Analyze CSS files for conflicts, overlaps, and usage."""
     
@@ -28,6 +37,7 @@ class CSSAnalyzer:
         self.selector_map: Dict[str, List[CSSRule]] = defaultdict(list)  # selector -> rules
         self.property_conflicts: List[Dict] = []  # List of conflicts
         self.page_css_usage: Dict[str, Set[str]] = {}  # page -> css files used
+        self._stats_cache: Optional[Dict] = None  # cleared by every method that changes the maps above
         
     def read_file_safe(self, file_path: Path) -> str:
         """Safely read file with encoding detection."""
@@ -48,6 +58,7 @@ class CSSAnalyzer:
         if not content:
             return []
         
+        self._stats_cache = None
         rules = []
         
         # Remove comments
@@ -87,10 +98,30 @@ class CSSAnalyzer:
         
         return rules
     
-    def analyze_css_files(self, css_files: Dict[str, Path]):
-        """Analyze all CSS files."""
+    def analyze_css_files(self, css_files: Dict[str, Path], max_workers: Optional[int] = None):
+        """Analyze all CSS files.
+        
+        When max_workers > 1, files are parsed in a process pool and the
+        selector map is rebuilt in this process.
+        """
         self.css_files.clear()
         self.selector_map.clear()
+        self._stats_cache = None
+        
+        if max_workers and max_workers > 1 and len(css_files) > 1:
+            tasks = [(self.root_dir, key, path) for key, path in css_files.items()]
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    parsed = list(executor.map(_parse_css_one, tasks, chunksize=16))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel CSS parsing unavailable, falling back to serial: {e}")
+            else:
+                for file_key, rules in parsed:
+                    self.css_files[file_key] = rules
+                    for rule in rules:
+                        self.selector_map[rule.selector].append(rule)
+                return
         
         for file_key, file_path in css_files.items():
             rules = self.parse_css_file(file_path, file_key)
@@ -99,6 +130,7 @@ class CSSAnalyzer:
     def find_conflicts(self):
         """Find conflicting CSS rules (same selector, different properties)."""
         self.property_conflicts.clear()
+        self._stats_cache = None
         
         for selector, rules in self.selector_map.items():
             if len(rules) < 2:
@@ -202,6 +234,7 @@ class CSSAnalyzer:
             css_files.add(css_path)
         
         self.page_css_usage[page_key] = css_files
+        self._stats_cache = None
         return css_files
     
     def analyze_page_style_conflicts(self, page_key: str) -> List[Dict]:
@@ -229,14 +262,17 @@ class CSSAnalyzer:
         return page_conflicts
     
     def get_statistics(self) -> Dict:
-        """Get CSS analysis statistics."""
+        """Get CSS analysis statistics, cached until the analysis changes."""
+        if self._stats_cache is not None:
+            return self._stats_cache
+        
         total_rules = sum(len(rules) for rules in self.css_files.values())
         total_selectors = len(self.selector_map)
         duplicate_selectors = sum(
             1 for rules in self.selector_map.values() if len(rules) > 1
         )
         
-        return {
+        self._stats_cache = {
             'total_css_files': len(self.css_files),
             'total_rules': total_rules,
             'unique_selectors': total_selectors,
@@ -244,6 +280,7 @@ class CSSAnalyzer:
             'property_conflicts': len(self.property_conflicts),
             'pages_analyzed': len(self.page_css_usage)
         }
+        return self._stats_cache
 
 
 class StyleErrorReportGenerator:
@@ -1,4 +1,7 @@
 """Build and manage dependency graph between files."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Set, List, Optional
 from pathlib import Path
 from OrphanHunter.scanner.file_scanner import FileInfo, FileScanner
@@ -8,6 +11,38 @@ from OrphanHunter.analyzer.reference_tracker import ReferenceTracker, SQLURLAnal
 from OrphanHunter.analyzer.asset_analyzer import AssetAnalyzer
 from OrphanHunter.analyzer.css_analyzer import CSSAnalyzer
 
+PAGE_EXTENSIONS = ('.php', '.html', '.htm')
+
+# Per-process parser state for parallel graph building
+_worker_state: Dict = {}
+
+
+def _init_parse_worker(root_dir: Path, sql_tables: Set[str]):
+    """Initialize parser instances once per worker process."""
+    _worker_state['root_dir'] = root_dir
+    _worker_state['sql_tables'] = sql_tables
+    _worker_state['php_parser'] = PHPParser()
+    _worker_state['sql_analyzer'] = SQLReferenceAnalyzer()
+    _worker_state['reference_tracker'] = ReferenceTracker(root_dir)
+
+
+def _parse_one(task):
+    """Parse a single file with the worker's parsers."""
+    file_key, file_path, extension = task
+    root_dir = _worker_state['root_dir']
+    sql_tables = _worker_state['sql_tables']
+    
+    refs = _worker_state['reference_tracker'].collect_references(file_path, file_key)
+    parse_result = None
+    table_refs = {}
+    if extension in PAGE_EXTENSIONS:
+        parse_result = _worker_state['php_parser'].parse_file(file_path, root_dir)
+        if sql_tables:
+            table_refs = _worker_state['sql_analyzer'].analyze_file_for_tables(file_path, sql_tables)
+    
+    return file_key, refs, parse_result, table_refs
+
+
 class DependencyGraph:
     """Manages file dependencies and reference tracking."""
     
@@ -29,9 +64,15 @@ class DependencyGraph:
         self.table_usage: Dict[str, Dict[str, int]] = {}    # file -> {table: count}
         self.table_files: Dict[str, Set[str]] = {}          # table -> files using it
         self.sql_urls: Set[str] = set()  # URLs found in SQL
+        self.parse_results: Dict[str, tuple] = {}  # file -> (refs, parse_result, table_refs)
         
-    def build_graph(self, sql_tables: Optional[Set[str]] = None, sql_dump_path: Optional[Path] = None):
-        """Build complete dependency graph."""
+    def build_graph(self, sql_tables: Optional[Set[str]] = None, sql_dump_path: Optional[Path] = None,
+                    max_workers: Optional[int] = None, cached_results: Optional[Dict[str, tuple]] = None):
+        """Build complete dependency graph.
+        
+        When max_workers > 1, per-file parsing runs in a process pool.
+        Files present in cached_results reuse their earlier parse instead of being re-read.
+        """
         sql_tables = sql_tables or set()
         
         # Initialize dictionaries
@@ -39,45 +80,17 @@ class DependencyGraph:
             self.file_dependencies[file_key] = set()
             self.file_dependents[file_key] = set()
         
-        # Parse each file (PHP, HTML, JS, TS, JSON)
-        for file_key, file_info in self.file_scanner.files.items():
-            # Use reference tracker for detailed tracking
-            self.reference_tracker.analyze_file(file_info.path, file_key)
-            
-            # Also use PHP parser for compatibility
-            if file_info.extension in ['.php', '.html', '.htm']:
-                parse_result = self.php_parser.parse_file(file_info.path, self.root_dir)
-                
-                # Store file dependencies
-                self.file_dependencies[file_key] = parse_result['all_references']
-                
-                # Update dependents
-                for ref in parse_result['all_references']:
-                    if ref in self.file_scanner.files:
-                        if ref not in self.file_dependents:
-                            self.file_dependents[ref] = set()
-                        self.file_dependents[ref].add(file_key)
-                
-                # Track functions
-                for func in parse_result['function_definitions']:
-                    if func not in self.function_definitions:
-                        self.function_definitions[func] = set()
-                    self.function_definitions[func].add(file_key)
-                
-                for func in parse_result['function_calls']:
-                    if func not in self.function_usage:
-                        self.function_usage[func] = set()
-                    self.function_usage[func].add(file_key)
-                
-                # Analyze SQL table usage
-                if sql_tables:
-                    table_refs = self.sql_analyzer.analyze_file_for_tables(file_info.path, sql_tables)
-                    if table_refs:
-                        self.table_usage[file_key] = table_refs
-                        for table, count in table_refs.items():
-                            if table not in self.table_files:
-                                self.table_files[table] = set()
-                            self.table_files[table].add(file_key)
+        # Parse each changed file (PHP, HTML, JS, TS, JSON)
+        self.parse_results = dict(cached_results or {})
+        changed = [
+            file_key for file_key in self.file_scanner.files
+            if file_key not in self.parse_results
+        ]
+        self.reparse_files(changed, sql_tables, max_workers)
+        
+        # Merge in scan order so the graph matches a full rebuild
+        for file_key in self.file_scanner.files:
+            self.add_parsed(file_key, *self.parse_results[file_key])
         
         # Analyze SQL dump for URL references
         if sql_dump_path and sql_dump_path.exists():
@@ -104,6 +117,79 @@ class DependencyGraph:
             file_info.referenced_by = dependents
             file_info.references = self.file_dependencies.get(file_key, set())
     
+    def reparse_files(self, file_keys: List[str], sql_tables: Set[str], max_workers: Optional[int] = None):
+        """Parse the given files and store their results in parse_results."""
+        tasks = [
+            (file_key, self.file_scanner.files[file_key].path, self.file_scanner.files[file_key].extension)
+            for file_key in file_keys
+        ]
+        for file_key, refs, parse_result, table_refs in self._parse_files(tasks, sql_tables, max_workers):
+            self.parse_results[file_key] = (refs, parse_result, table_refs)
+    
+    def _parse_files(self, tasks: List, sql_tables: Set[str], max_workers: Optional[int]):
+        """Yield parse results, using a process pool when worthwhile."""
+        if max_workers and max_workers > 1 and len(tasks) > 1:
+            try:
+                # Spawn, not fork: this runs from a QThread and forking a threaded process can deadlock
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_parse_worker,
+                    initargs=(self.root_dir, sql_tables)
+                ) as executor:
+                    results = list(executor.map(_parse_one, tasks, chunksize=64))
+                yield from results
+                return
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel parsing unavailable, falling back to serial: {e}")
+        
+        _init_parse_worker(self.root_dir, sql_tables)
+        try:
+            for task in tasks:
+                yield _parse_one(task)
+        finally:
+            _worker_state.clear()
+    
+    def add_parsed(self, file_key: str, refs: List, parse_result: Optional[Dict],
+                   table_refs: Dict[str, int]):
+        """Merge the parse results of a single file into the graph."""
+        self.reference_tracker.add_references(refs)
+        
+        if parse_result is None:
+            return
+        
+        # Store file dependencies
+        self.file_dependencies[file_key] = parse_result['all_references']
+        
+        # Update dependents; the keys-view intersection resolves known files in C
+        file_dependents = self.file_dependents
+        for ref in self.file_scanner.files.keys() & parse_result['all_references']:
+            dependents = file_dependents.get(ref)
+            if dependents is None:
+                dependents = file_dependents[ref] = set()
+            dependents.add(file_key)
+        
+        # Track functions
+        self._index_names(self.function_definitions, parse_result['function_definitions'], file_key)
+        self._index_names(self.function_usage, parse_result['function_calls'], file_key)
+        
+        # Analyze SQL table usage
+        if table_refs:
+            self.table_usage[file_key] = table_refs
+            for table, count in table_refs.items():
+                if table not in self.table_files:
+                    self.table_files[table] = set()
+                self.table_files[table].add(file_key)
+    
+    @staticmethod
+    def _index_names(index: Dict[str, Set[str]], names, file_key: str):
+        """Record file_key under each name in index."""
+        for name in names:
+            files = index.get(name)
+            if files is None:
+                files = index[name] = set()
+            files.add(file_key)
+    
     def get_file_references(self, file_key: str) -> Set[str]:
         """Get all files referenced by the given file."""
         return self.file_dependencies.get(file_key, set())
@@ -114,49 +200,43 @@ class DependencyGraph:
     
     def get_orphaned_files(self, criteria: Dict) -> Set[str]:
         """Identify orphaned files based on criteria."""
-        orphaned = set()
-        navigation_files_set = set(self.file_scanner.navigation_files)
-        exclude_patterns = set(criteria.get('exclude_patterns', []))
+        is_orphaned = self._build_orphan_predicate(criteria or {})
+        return {
+            file_key for file_key, file_info in self.file_scanner.files.items()
+            if is_orphaned(file_key, file_info)
+        }
+    
+    def _build_orphan_predicate(self, criteria: Dict):
+        """Compile the criteria dict into a single per-file check."""
+        navigation_files_set = frozenset(self.file_scanner.navigation_files)
+        exclude_patterns = tuple(set(criteria.get('exclude_patterns', [])))
         
-        for file_key, file_info in self.file_scanner.files.items():
-            # Skip critical files
-            if file_info.is_critical:
-                continue
-            
-            # Skip navigation files themselves
-            if file_info.is_navigation:
-                continue
+        # Each check returns True when it rules the file out as an orphan
+        checks = []
+        if criteria.get('not_in_navigation', True):
+            # Referenced by any navigation file
+            checks.append(lambda file_info: not navigation_files_set.isdisjoint(file_info.referenced_by))
+        if criteria.get('not_included_anywhere', True):
+            # Referenced by any file at all
+            checks.append(lambda file_info: bool(file_info.referenced_by))
+        if criteria.get('not_referenced', True):
+            checks.append(lambda file_info: file_info.reference_count > 0)
+        min_refs = criteria.get('min_reference_count', 0)
+        if min_refs > 0:
+            checks.append(lambda file_info: file_info.reference_count >= min_refs)
+        
+        def is_orphaned(file_key: str, file_info: FileInfo) -> bool:
+            # Critical and navigation files are never orphans
+            if file_info.is_critical or file_info.is_navigation:
+                return False
             
             # Apply exclusion patterns (suffix match)
-            if exclude_patterns and any(file_key.endswith(pattern) for pattern in exclude_patterns):
-                continue
-
-            is_orphaned = True
-            
-            # Check criteria
-            if criteria.get('not_in_navigation', True) and is_orphaned:
-                # Check if referenced by any navigation file
-                if file_info.referenced_by & navigation_files_set:
-                    is_orphaned = False
-            
-            if criteria.get('not_included_anywhere', True) and is_orphaned:
-                # Check if referenced by any file at all
-                if file_info.referenced_by:
-                    is_orphaned = False
-            
-            if criteria.get('not_referenced', True) and is_orphaned:
-                if file_info.reference_count > 0:
-                    is_orphaned = False
-            
-            # Check minimum reference count
-            min_refs = criteria.get('min_reference_count', 0)
-            if min_refs > 0 and file_info.reference_count >= min_refs:
-                is_orphaned = False
+            if exclude_patterns and file_key.endswith(exclude_patterns):
+                return False
             
-            if is_orphaned:
-                orphaned.add(file_key)
+            return not any(check(file_info) for check in checks)
         
-        return orphaned
+        return is_orphaned
     
     def get_deletion_impact(self, file_keys: Set[str]) -> Dict:
         """Analyze the impact of deleting given files."""
@@ -0,0 +1,83 @@
+"""On-disk cache of per-file parse results for incremental scans."""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from OrphanHunter.scanner.file_scanner import FileScanner
+
+CACHE_VERSION = 1
+
+
+class GraphCache:
+    """Persist dependency parse results so unchanged files are not re-parsed."""
+
+    def __init__(self, root_dir: Path, cache_dir: Optional[Path] = None):
+        self.root_dir = Path(root_dir).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.cache' / 'orphanhunter'
+        digest = hashlib.sha1(str(self.root_dir).encode('utf-8')).hexdigest()[:16]
+        self.cache_path = self.cache_dir / f"graph-{digest}.pkl"
+        self.stale_entries = 0  # cached entries the last load could not reuse
+
+    def _build_manifest(self, file_scanner: FileScanner) -> Dict[str, Tuple[int, int]]:
+        """Map each file key to its (mtime_ns, size) stat signature."""
+        return {
+            file_key: (file_info.mtime_ns, file_info.size)
+            for file_key, file_info in file_scanner.files.items()
+        }
+
+    def load(self, file_scanner: FileScanner, sql_tables: Set[str]) -> Dict[str, Tuple]:
+        """Return cached parse results for files whose stat signature is unchanged."""
+        self.stale_entries = 0
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Ignoring unreadable graph cache {self.cache_path}: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+
+        # Table reference counts depend on the known tables
+        if data.get('sql_tables') != set(sql_tables):
+            return {}
+
+        cached_manifest = data.get('manifest', {})
+        cached_results = data.get('results', {})
+
+        fresh = {}
+        for file_key, signature in self._build_manifest(file_scanner).items():
+            if cached_manifest.get(file_key) == signature and file_key in cached_results:
+                fresh[file_key] = cached_results[file_key]
+        # Changed or removed files leave entries that a save would drop
+        self.stale_entries = len(cached_results) - len(fresh)
+        return fresh
+
+    def save(self, file_scanner: FileScanner, sql_tables: Set[str], parse_results: Dict[str, Tuple]):
+        """Write parse results and their stat manifest to disk."""
+        data = {
+            'version': CACHE_VERSION,
+            'root_directory': str(self.root_dir),
+            'sql_tables': set(sql_tables),
+            'manifest': self._build_manifest(file_scanner),
+            'results': parse_results
+        }
+
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving graph cache: {e}")
+
+    def clear(self):
+        """Delete the cache file for this root directory."""
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
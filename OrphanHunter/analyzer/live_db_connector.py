@@ -112,6 +112,7 @@ class LiveDatabaseConnector:
         self.monitoring = False
         self.monitor_thread = None
         self.monitor_callback = None
+        self._monitor_stop = threading.Event()
         self.last_check_time = 0
         
     def connect(self, credentials: Dict[str, Optional[str]]) -> Tuple[bool, str]:
@@ -370,12 +371,14 @@ class LiveDatabaseConnector:
         
         self.monitoring = True
         self.monitor_callback = callback
+        self._monitor_stop.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
         self.monitor_thread.start()
     
     def stop_monitoring(self):
         """Stop live monitoring."""
         self.monitoring = False
+        self._monitor_stop.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
             self.monitor_thread = None
@@ -402,11 +405,9 @@ class LiveDatabaseConnector:
             
             self.last_check_time = current_time
             
-            # Sleep in small intervals to allow quick shutdown
-            for _ in range(interval * 10):
-                if not self.monitoring:
-                    break
-                time.sleep(0.1)
+            # Sleep until the next check; stop_monitoring() wakes the wait early
+            if self._monitor_stop.wait(interval):
+                break
 
 
 class DatabaseAnalyzer:
@@ -112,12 +112,13 @@ class ReferenceTracker:
         
         return path.replace('\\', '/')
     
-    def analyze_file(self, file_path: Path, relative_path: str):
-        """Analyze a file for references to other files."""
+    def collect_references(self, file_path: Path, relative_path: str) -> List[FileReference]:
+        """Collect references from a file without recording them."""
         lines = self.read_file_safe(file_path)
         if not lines:
-            return
+            return []
         
+        found = []
         for line_num, line_content in enumerate(lines, start=1):
             # Try each pattern
             for ref_type, pattern in self.patterns.items():
@@ -126,17 +127,26 @@ class ReferenceTracker:
                     normalized = self.normalize_path(referenced_path, file_path)
                     
                     if normalized:
-                        ref = FileReference(
+                        found.append(FileReference(
                             source_file=relative_path,
                             target_file=normalized,
                             line_number=line_num,
                             line_content=line_content,
                             reference_type=ref_type
-                        )
-                        
-                        if normalized not in self.references:
-                            self.references[normalized] = []
-                        self.references[normalized].append(ref)
+                        ))
+        
+        return found
+    
+    def add_references(self, refs: List[FileReference]):
+        """Record previously collected references."""
+        for ref in refs:
+            if ref.target_file not in self.references:
+                self.references[ref.target_file] = []
+            self.references[ref.target_file].append(ref)
+    
+    def analyze_file(self, file_path: Path, relative_path: str):
+        """Analyze a file for references to other files."""
+        self.add_references(self.collect_references(file_path, relative_path))
     
     def get_references_to(self, file_key: str) -> List[FileReference]:
         """Get all references to a specific file."""
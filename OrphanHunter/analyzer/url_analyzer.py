@@ -1,11 +1,51 @@
 """URL detection and analysis for migration."""
+import multiprocessing
+import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 import chardet
 from urllib.parse import urlparse
 
+# Patterns are fixed strings, so each one is compiled once per process and shared
+_compile = lru_cache(maxsize=256)(re.compile)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_host_cached(domain: str) -> str:
+    """Normalize domain by removing protocol, trailing slashes and port.
+    
+    Unlike URLConfig's normalization, the port is dropped so that URLs on any
+    port of an internal host compare equal to the configured domain.
+    """
+    domain = domain.strip()
+    domain = domain.replace('https://', '').replace('http://', '')
+    domain = domain.rstrip('/')
+    # Remove port if present for comparison
+    domain = domain.split(':')[0]
+    return domain
+
+
+# Per-process analyzer for parallel directory scans
+_worker_state: Dict = {}
+
+
+def _init_scan_worker(internal_domains: List[str], external_whitelist: List[str]):
+    """Create the analyzer once per worker process."""
+    _worker_state['analyzer'] = URLAnalyzer(internal_domains, external_whitelist)
+
+
+def _scan_one(task):
+    """Scan one file with the worker's analyzer."""
+    file_path, root_dir = task
+    return _worker_state['analyzer']._scan_file(file_path, root_dir)
+
 
 @dataclass
 class URLInstance:
@@ -42,12 +82,15 @@ class URLAnalyzer:
     
     def __init__(self, internal_domains: List[str], external_whitelist: List[str] = None):
         self.internal_domains = [self._normalize_domain(d) for d in internal_domains]
+        self._internal_domain_set = frozenset(self.internal_domains)
         self.external_whitelist = external_whitelist or []
         self.url_instances: List[URLInstance] = []
+        self.file_results: Dict[str, Tuple] = {}  # file -> ((mtime_ns, size), URL instances)
+        self.results_changed = False
         self.helper_functions: List[HelperFunction] = []
         
         # Comprehensive URL pattern - matches http:// and https://
-        self.url_pattern = re.compile(
+        self.url_pattern = _compile(
             r'(?:https?://)'  # Protocol
             r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'  # Subdomains
             r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'  # Domain
@@ -72,8 +115,14 @@ class URLAnalyzer:
     
     def scan_file(self, file_path: Path, root_dir: Path) -> List[URLInstance]:
         """Scan a single file for URLs."""
+        return self._scan_file(file_path, root_dir) or []
+    
+    def _scan_file(self, file_path: Path, root_dir: Path) -> Optional[List[URLInstance]]:
+        """Scan a single file for URLs, returning None if it could not be read."""
         try:
             content = self._read_file_safe(file_path)
+            if content is None:
+                return None
             if not content:
                 return []
             
@@ -92,7 +141,7 @@ class URLAnalyzer:
                     # Parse URL
                     parsed = urlparse(url)
                     domain = self._normalize_domain(f"{parsed.netloc}")
-                    is_internal = domain in self.internal_domains
+                    is_internal = domain in self._internal_domain_set
                     
                     # Get context lines
                     context_before = lines[max(0, line_num-4):line_num-1]
@@ -118,34 +167,174 @@ class URLAnalyzer:
             
         except Exception as e:
             print(f"Error scanning {file_path}: {e}")
-            return []
+            return None
+    
+    def cache_settings(self) -> Tuple:
+        """Settings that decide which URLs a file yields, used to validate cached results.
+        
+        Internal domains are left out: reused results are reclassified in memory.
+        """
+        return (tuple(self.external_whitelist),)
+    
+    def classify(self, instances: List[URLInstance]):
+        """Re-apply the internal domain classification to already extracted URLs."""
+        internal_domain_set = self._internal_domain_set
+        for instance in instances:
+            instance.is_internal = instance.domain in internal_domain_set
     
     def scan_directory(self, root_dir: Path, file_types: List[str], 
-                      ignore_patterns: List[str] = None) -> List[URLInstance]:
-        """Scan entire directory structure for URLs."""
+                      ignore_patterns: List[str] = None, max_workers: Optional[int] = None,
+                      cached_results: Optional[Dict[str, Tuple]] = None) -> List[URLInstance]:
+        """Scan entire directory structure for URLs.
+        
+        Files present in cached_results with an unchanged (mtime, size) stat
+        signature reuse their earlier results instead of being re-read; those
+        are reclassified against the current internal domains. Files that could
+        not be read are recorded with None results so they are always rescanned.
+        results_changed is set when any file was rescanned or has disappeared.
+        When max_workers > 1, the remaining files are scanned in a process pool
+        (encoding detection and URL classification are pure Python and hold the
+        GIL), falling back to a thread pool; results keep the directory walk order.
+        """
         ignore_patterns = ignore_patterns or []
+        cached_results = cached_results or {}
         self.url_instances.clear()
         
-        for file_path in root_dir.rglob('*'):
-            if not file_path.is_file():
-                continue
+        files = list(self._iter_files(root_dir, file_types, ignore_patterns))
+        
+        file_results = {}
+        changed = []
+        for file_path in files:
+            file_key = str(file_path)
+            try:
+                stat_result = os.stat(file_key)
+                signature = (stat_result.st_mtime_ns, stat_result.st_size)
+            except OSError:
+                signature = None
             
-            # Check if file type is enabled
-            if file_types and file_path.suffix not in file_types:
+            cached = cached_results.get(file_key)
+            if signature is not None and cached is not None and cached[1] is not None and cached[0] == signature:
+                self.classify(cached[1])
+                file_results[file_key] = cached
+            else:
+                file_results[file_key] = (signature, None)
+                changed.append(file_path)
+        
+        for file_path, instances in zip(changed, self._scan_files(changed, root_dir, max_workers)):
+            file_key = str(file_path)
+            file_results[file_key] = (file_results[file_key][0], instances)
+        
+        self.file_results = file_results
+        self.results_changed = bool(changed) or not cached_results.keys() <= file_results.keys()
+        self.url_instances.extend(chain.from_iterable(
+            instances for _, instances in file_results.values() if instances
+        ))
+        
+        return self.url_instances
+    
+    def _scan_files(self, files: List[Path], root_dir: Path, max_workers: Optional[int]) -> List[Optional[List[URLInstance]]]:
+        """Scan files, using a process pool when worthwhile, and return results in order."""
+        if max_workers and max_workers > 1 and len(files) > 1:
+            try:
+                # Spawn, not fork: scans run from a QThread and forking a threaded process can deadlock
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_scan_worker,
+                    initargs=(self.internal_domains, self.external_whitelist)
+                ) as executor:
+                    return list(executor.map(_scan_one, [(f, root_dir) for f in files], chunksize=32))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel URL scanning unavailable, falling back to threads: {e}")
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    return list(executor.map(lambda file_path: self._scan_file(file_path, root_dir), files))
+        
+        return [self._scan_file(file_path, root_dir) for file_path in files]
+    
+    def _iter_files(self, root_dir: Path, file_types: List[str], ignore_patterns: List[str]):
+        """Yield files to scan in rglob order, using one os.scandir per directory.
+        
+        A file is ignored when any pattern is a substring of its full path; when
+        patterns are given, dotfiles are skipped as well. All patterns are matched
+        with one regex, and directories whose path already contains a pattern are
+        not descended into.
+        """
+        ignore_re = None
+        if ignore_patterns:
+            ignore_re = re.compile('|'.join(re.escape(p) for p in ignore_patterns))
+        file_types = set(file_types or ())
+        
+        pending = [str(root_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
                 continue
             
-            # Check ignore patterns
-            if self._should_ignore(file_path, ignore_patterns):
-                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Every file below an ignored directory would be ignored too
+                        if not (ignore_re and ignore_re.search(entry.path)):
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                
+                # Check if file type is enabled
+                if file_types and os.path.splitext(entry.name)[1] not in file_types:
+                    continue
+                
+                # Check ignore patterns (dotfiles are skipped whenever patterns are given)
+                if ignore_re and (entry.name.startswith('.') or ignore_re.search(entry.path)):
+                    continue
+                
+                yield Path(entry.path)
             
-            instances = self.scan_file(file_path, root_dir)
-            self.url_instances.extend(instances)
+            pending.extend(reversed(subdirs))
+    
+    def find_files_named(self, root_dir: Path, filename: str, limit: int,
+                         ignore_patterns: List[str] = None,
+                         ignore_dot_directories: bool = False) -> List[Path]:
+        """Breadth-first search for up to limit files called filename.
         
-        return self.url_instances
+        Stops walking as soon as enough matches are found and never descends
+        into directories matching ignore_patterns, or into dot directories
+        when ignore_dot_directories is set.
+        """
+        ignore_patterns = ignore_patterns or []
+        matches = []
+        pending = deque([str(root_dir)])
+        while pending:
+            try:
+                with os.scandir(pending.popleft()) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if ignore_dot_directories and entry.name.startswith('.'):
+                            continue
+                        if not any(p in entry.path for p in ignore_patterns):
+                            pending.append(entry.path)
+                    elif entry.name == filename:
+                        matches.append(Path(entry.path))
+                        if len(matches) >= limit:
+                            return matches
+                except OSError:
+                    continue
+        return matches
     
     def detect_helper_functions(self, config_files: List[Path]) -> List[HelperFunction]:
         """Detect URL helper functions in config/header files."""
         self.helper_functions.clear()
+        found_names = set()
         
         for config_file in config_files:
             if not config_file.exists():
@@ -157,25 +346,27 @@ class URLAnalyzer:
                     continue
                 
                 for pattern, name in self.helper_patterns:
-                    matches = re.finditer(pattern, content, re.MULTILINE)
-                    for match in matches:
-                        # Extract example line
-                        line_start = content.rfind('\n', 0, match.start()) + 1
-                        line_end = content.find('\n', match.end())
-                        if line_end == -1:
-                            line_end = len(content)
-                        example = content[line_start:line_end].strip()
-                        
-                        helper = HelperFunction(
-                            name=name,
-                            pattern=pattern,
-                            file_found=str(config_file),
-                            example=example
-                        )
-                        
-                        # Avoid duplicates
-                        if not any(h.name == helper.name for h in self.helper_functions):
-                            self.helper_functions.append(helper)
+                    # Only the first definition of each helper is kept
+                    if name in found_names:
+                        continue
+                    match = _compile(pattern, re.MULTILINE).search(content)
+                    if not match:
+                        continue
+                    found_names.add(name)
+                    
+                    # Extract example line
+                    line_start = content.rfind('\n', 0, match.start()) + 1
+                    line_end = content.find('\n', match.end())
+                    if line_end == -1:
+                        line_end = len(content)
+                    example = content[line_start:line_end].strip()
+                    
+                    self.helper_functions.append(HelperFunction(
+                        name=name,
+                        pattern=pattern,
+                        file_found=str(config_file),
+                        example=example
+                    ))
                 
             except Exception as e:
                 print(f"Error detecting helpers in {config_file}: {e}")
@@ -205,7 +396,7 @@ class URLAnalyzer:
             ]
             
             for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+                matches = _compile(pattern, re.IGNORECASE).finditer(content)
                 for match in matches:
                     domain = self._normalize_domain(match.group(1))
                     if domain and domain not in domains:
@@ -259,8 +450,8 @@ class URLAnalyzer:
             by_file[instance.file_path].append(instance)
         return by_file
     
-    def _read_file_safe(self, file_path: Path) -> str:
-        """Safely read file with encoding detection."""
+    def _read_file_safe(self, file_path: Path) -> Optional[str]:
+        """Safely read file with encoding detection; returns None on failure."""
         try:
             with open(file_path, 'rb') as f:
                 raw_data = f.read()
@@ -271,16 +462,11 @@ class URLAnalyzer:
                 return f.read()
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
-            return ""
+            return None
     
     def _normalize_domain(self, domain: str) -> str:
-        """Normalize domain by removing protocol and trailing slashes."""
-        domain = domain.strip()
-        domain = domain.replace('https://', '').replace('http://', '')
-        domain = domain.rstrip('/')
-        # Remove port if present for comparison
-        domain = domain.split(':')[0]
-        return domain
+        """Normalize domain by removing protocol, trailing slashes and port."""
+        return _normalize_host_cached(domain)
     
     def _is_whitelisted(self, url: str) -> bool:
         """Check if URL is in whitelist."""
@@ -288,12 +474,4 @@ class URLAnalyzer:
             if url.startswith(whitelisted):
                 return True
         return False
-    
-    def _should_ignore(self, file_path: Path, ignore_patterns: List[str]) -> bool:
-        """Check if file should be ignored."""
-        file_str = str(file_path)
-        for pattern in ignore_patterns:
-            if pattern in file_str or file_path.name.startswith('.'):
-                return True
-        return False
 
@@ -0,0 +1,64 @@
+"""On-disk cache of per-file URL scan results for repeated migration scans."""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from OrphanHunter.analyzer.url_analyzer import URLInstance
+
+CACHE_VERSION = 2
+
+
+class URLScanCache:
+    """Persist URL scan results so unchanged files are not re-read."""
+
+    def __init__(self, root_dir: Path, cache_dir: Optional[Path] = None):
+        self.root_dir = Path(root_dir).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.cache' / 'orphanhunter'
+        digest = hashlib.sha1(str(self.root_dir).encode('utf-8')).hexdigest()[:16]
+        self.cache_path = self.cache_dir / f"urls-{digest}.pkl"
+
+    def load(self, settings: Tuple) -> Dict[str, Tuple[Tuple[int, int], List[URLInstance]]]:
+        """Return cached per-file results if they were produced with the same settings."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Ignoring unreadable URL scan cache {self.cache_path}: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+
+        # Whitelisted URLs are dropped at extraction time
+        if data.get('settings') != settings:
+            return {}
+
+        return data.get('results', {})
+
+    def save(self, settings: Tuple, file_results: Dict[str, Tuple[Tuple[int, int], List[URLInstance]]]):
+        """Write per-file results and their stat signatures to disk."""
+        data = {
+            'version': CACHE_VERSION,
+            'root_directory': str(self.root_dir),
+            'settings': settings,
+            'results': file_results
+        }
+
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving URL scan cache: {e}")
+
+    def clear(self):
+        """Delete the cache file for this root directory."""
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
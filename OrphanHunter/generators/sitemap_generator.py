@@ -2,8 +2,7 @@
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
-from xml.etree.ElementTree import Element, SubElement, tostring, ElementTree
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 from OrphanHunter.scanner.file_scanner import FileScanner
 
 class SitemapGenerator:
@@ -78,9 +77,11 @@ class SitemapGenerator:
     
     def generate_sitemap(self, output_path: Path = None) -> str:
         """Generate sitemap.xml content."""
-        # Create XML structure
-        urlset = Element('urlset')
-        urlset.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
+        # Emit the XML line by line instead of building and pretty-printing a DOM
+        xml_lines = [
+            '<?xml version="1.0" ?>',
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        ]
         
         # Add URLs
         for file_info in self.file_scanner.files.values():
@@ -90,26 +91,19 @@ class SitemapGenerator:
             if not file_info.path.exists():
                 continue
             
-            url = SubElement(urlset, 'url')
-            
-            # Location
-            loc = SubElement(url, 'loc')
-            loc.text = self.get_url_from_file(file_info)
-            
-            # Last modified
-            lastmod = SubElement(url, 'lastmod')
             mod_time = datetime.fromtimestamp(file_info.modified_time)
-            lastmod.text = mod_time.strftime('%Y-%m-%d')
-            
-            # Priority
-            priority = SubElement(url, 'priority')
-            priority.text = str(self.calculate_priority(file_info))
-        
-        # Convert to pretty XML string
-        xml_str = minidom.parseString(tostring(urlset)).toprettyxml(indent='  ')
-        
-        # Remove extra blank lines
-        xml_lines = [line for line in xml_str.split('\n') if line.strip()]
+            xml_lines.extend((
+                '  <url>',
+                f'    <loc>{escape(self.get_url_from_file(file_info))}</loc>',
+                f"    <lastmod>{mod_time.strftime('%Y-%m-%d')}</lastmod>",
+                f'    <priority>{self.calculate_priority(file_info)}</priority>',
+                '  </url>'
+            ))
+        
+        if len(xml_lines) == 2:
+            xml_lines[1] = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"/>'
+        else:
+            xml_lines.append('</urlset>')
         xml_str = '\n'.join(xml_lines)
         
         # Save to file if path provided
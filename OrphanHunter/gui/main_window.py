@@ -1,43 +1,128 @@
 """Main window for System Mapper application."""
+import importlib
+import importlib.util
+import os
 import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
+from typing import Dict, FrozenSet, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTabWidget, QLabel, QLineEdit, QFileDialog, QMessageBox,
     QGroupBox, QFormLayout, QCheckBox, QSpinBox, QTextEdit,
-    QSplitter, QDialog, QDialogButtonBox
+    QSplitter, QDialog, QDialogButtonBox, QPlainTextEdit,
+    QListWidget, QListWidgetItem
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QObject, QProcess, QThread, QTimer, QUrl, pyqtSignal
+from PyQt5.QtGui import QIcon, QTextCursor, QTextDocument
 
 from OrphanHunter.utils.config import Config
 from OrphanHunter.utils.logger import Logger
 from OrphanHunter.scanner.file_scanner import FileScanner
-from OrphanHunter.scanner.site_scanner import SiteScanner, SiteScannerDB
-from OrphanHunter.analyzer.php_parser import PHPParser
-from OrphanHunter.analyzer.sql_parser import SQLParser, SQLReferenceAnalyzer
-from OrphanHunter.analyzer.live_db_connector import LiveDatabaseConnector
-from OrphanHunter.analyzer.dependency_graph import DependencyGraph
 from OrphanHunter.operations.backup_manager import BackupManager
 from OrphanHunter.operations.deletion_manager import DeletionManager
-from OrphanHunter.operations.sanity_checker import SanityChecker
-from OrphanHunter.generators.sitemap_generator import SitemapGenerator
-from OrphanHunter.generators.markdown_generator import MarkdownGenerator
-from OrphanHunter.gui.widgets import FileTreeWidget, LogConsole, StatusPanel, StatsWidget
-from OrphanHunter.gui.url_migration_window import URLMigrationWindow
+from OrphanHunter.gui.widgets import BackupListDialog, FileTreeWidget, LogConsole, StatusPanel, StatsWidget
+
+
+def _existing_path(path_str):
+    """Return a Path if path_str names an existing file (one stat call), else None."""
+    if not path_str:
+        return None
+    try:
+        os.stat(path_str)
+    except OSError:
+        return None
+    return Path(path_str)
+
+
+class _ScanCancelled(Exception):
+    """Raised inside ScanWorker when the user stops the scan."""
+
+
+class _CrawlSignals(QObject):
+    """Carries SiteScanner events from the crawl thread to the GUI thread."""
+    
+    stats_updated = pyqtSignal(dict)
+    crawl_finished = pyqtSignal(dict)
+
+
+@dataclass(frozen=True)
+class _ScanCfg:
+    """Immutable snapshot of the settings a scan reads."""
+    ignore_patterns: Tuple[str, ...]
+    ignore_dot: bool
+    blacklist: Tuple[str, ...]
+    scan_exts: FrozenSet[str]
+    critical_files: FrozenSet[str]
+    navigation_files: FrozenSet[str]
+    use_live_db: bool
+    config_php_path: str
+    sql_dump_path: str
+    force_full_rescan: bool
+    enable_orphan_analysis: bool
+    enable_asset_analysis: bool
+    enable_css_analysis: bool
+    orphan_criteria: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_config(cls, config: Config) -> '_ScanCfg':
+        """Read every scan setting from config once."""
+        return cls(
+            ignore_patterns=tuple(config.get_ignore_patterns()),
+            ignore_dot=config.should_ignore_dot_directories(),
+            blacklist=tuple(config.get_blacklist_directories()),
+            scan_exts=frozenset(config.get('scan_extensions') or ()),
+            critical_files=frozenset(config.get_critical_files()),
+            navigation_files=frozenset(config.get('navigation_files') or ()),
+            use_live_db=config.get('use_live_database', False),
+            config_php_path=config.get('config_php_path', ''),
+            sql_dump_path=config.get('sql_dump_path', ''),
+            force_full_rescan=config.get('force_full_rescan', False),
+            enable_orphan_analysis=config.get('enable_orphan_analysis', True),
+            enable_asset_analysis=config.get('enable_asset_analysis', True),
+            enable_css_analysis=config.get('enable_css_analysis', True),
+            orphan_criteria=dict(config.get('orphan_criteria') or {})
+        )
 
 
 class ScanWorker(QThread):
     """Worker thread for scanning operations."""
     
     progress = pyqtSignal(str)
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal()  # result is read from the worker's result attribute
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    
+    PROGRESS_EVERY = 64  # files between cancel checks in per-file loops
+    PROGRESS_INTERVAL = 0.033  # seconds between counter messages (~30Hz)
     
     def __init__(self, root_dir, config):
         super().__init__()
         self.root_dir = root_dir
         self.config = config
+        self.cfg = _ScanCfg.from_config(config)
+        self.result = {}
+        self._cancel = False
+        self._last_emit = 0.0
+    
+    def cancel(self):
+        """Ask the scan to stop at its next checkpoint."""
+        self._cancel = True
+    
+    def _check_cancel(self):
+        """Abort the scan if cancel() was called."""
+        if self._cancel:
+            raise _ScanCancelled()
+    
+    def _emit_throttled(self, message: str):
+        """Emit a counter-style progress message at most every PROGRESS_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_emit > self.PROGRESS_INTERVAL:
+            self._last_emit = now
+            self.progress.emit(message)
     
     def run(self):
         """Run the scan operation."""
@@ -46,31 +131,33 @@ class ScanWorker(QThread):
             
             # Scan files
             self.progress.emit("Scanning files...")
+            cfg = self.cfg
             scanner = FileScanner(
                 self.root_dir,
-                self.config.get_ignore_patterns(),
-                self.config.should_ignore_dot_directories(),
-                self.config.get_blacklist_directories()
+                list(cfg.ignore_patterns),
+                cfg.ignore_dot,
+                list(cfg.blacklist)
             )
-            scanner.scan(self.config.get('scan_extensions'))
-            scanner.mark_critical_files(self.config.get_critical_files())
-            scanner.mark_navigation_files(self.config.get('navigation_files'))
+            scanner.scan(cfg.scan_exts)
+            scanner.mark_critical_files(cfg.critical_files)
+            scanner.mark_navigation_files(cfg.navigation_files)
             result['scanner'] = scanner
+            result['ext_counts'] = dict(scanner.stats['ext_counts'])
+            self._check_cancel()
             
             # Parse SQL or connect to live database
             sql_tables = set()
-            use_live_db = self.config.get('use_live_database', False)
-            
-            if use_live_db:
+            sql_dump_path = None
+            if cfg.use_live_db:
                 # Use live database connection
-                config_php = self.config.get('config_php_path')
-                if config_php and Path(config_php).exists():
+                config_php = _existing_path(cfg.config_php_path)
+                if config_php:
                     self.progress.emit("Connecting to live database...")
                     try:
                         from OrphanHunter.analyzer.live_db_connector import DatabaseAnalyzer
                         
                         db_analyzer = DatabaseAnalyzer()
-                        success, message = db_analyzer.load_from_config(Path(config_php))
+                        success, message = db_analyzer.load_from_config(config_php)
                         
                         if success:
                             known_files = set()  # Will be populated after scan
@@ -90,64 +177,180 @@ class ScanWorker(QThread):
                             self.progress.emit(f"Config error: {message}")
                     
                     except ImportError:
-                        self.progress.emit("Installing mysql-connector-python...")
-                        import subprocess
-                        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'mysql-connector-python'])
-                        self.progress.emit("Package installed. Please restart scan.")
+                        raise RuntimeError("mysql-connector-python not installed; install from settings")
                     except Exception as e:
                         self.progress.emit(f"Live DB error: {e}")
             else:
                 # Use SQL dump file
-                sql_dump = self.config.get('sql_dump_path')
-                if sql_dump and Path(sql_dump).exists():
+                sql_dump_path = _existing_path(cfg.sql_dump_path)
+                if sql_dump_path:
                     self.progress.emit("Parsing SQL dump...")
+                    from OrphanHunter.analyzer.sql_parser import SQLParser
                     sql_parser = SQLParser()
-                    table_info = sql_parser.parse_sql_file(Path(sql_dump))
+                    table_info = sql_parser.parse_sql_file(sql_dump_path)
                     sql_tables = set(table_info.keys())
                     result['sql_tables'] = sql_tables
                     result['table_info'] = table_info
             
-            # Build dependency graph
-            self.progress.emit("Building dependency graph...")
-            dep_graph = DependencyGraph(scanner, Path(self.root_dir))
-            sql_dump_path = Path(sql_dump) if sql_dump else None
-            dep_graph.build_graph(sql_tables, sql_dump_path)
-            result['dependency_graph'] = dep_graph
+            result['dependency_graph'] = None
+            result['orphaned_files'] = set()
+            if cfg.enable_orphan_analysis:
+                self._analyze_references(scanner, sql_tables, sql_dump_path, result)
             
-            # Find orphaned files
-            self.progress.emit("Identifying orphaned files...")
-            orphaned = dep_graph.get_orphaned_files(
-                self.config.get('orphan_criteria')
-            )
-            result['orphaned_files'] = orphaned
+            self.progress.emit("Scan complete!")
+            self.result = result
+            self.finished.emit()
             
-            # Analyze assets (JS, TS, JSON, CSS orphans)
-            if self.config.get('enable_asset_analysis', True):
-                self.progress.emit("Analyzing assets (JS, TS, JSON, CSS)...")
-                dep_graph.asset_analyzer.analyze()
-                result['asset_summary'] = dep_graph.asset_analyzer.get_asset_summary()
+        except _ScanCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _analyze_references(self, scanner, sql_tables, sql_dump_path, result: dict):
+        """Build the dependency graph, then run orphan, asset and CSS analysis on it."""
+        from OrphanHunter.analyzer.dependency_graph import DependencyGraph, PAGE_EXTENSIONS
+        from OrphanHunter.analyzer.graph_cache import GraphCache
+        cfg = self.cfg
+        
+        # Build dependency graph
+        self.progress.emit("Building dependency graph...")
+        dep_graph = DependencyGraph(scanner, Path(self.root_dir))
+        graph_cache = GraphCache(Path(self.root_dir))
+        cached_results = {}
+        if not cfg.force_full_rescan:
+            cached_results = graph_cache.load(scanner, sql_tables)
+        changed = len(scanner.files) - len(cached_results)
+        if cached_results:
+            self.progress.emit(f"Reusing cached parse for {len(cached_results)} files, re-parsing {changed}...")
+        dep_graph.build_graph(sql_tables, sql_dump_path, max_workers=os.cpu_count(),
+                              cached_results=cached_results)
+        if changed or graph_cache.stale_entries:
+            graph_cache.save(scanner, sql_tables, dep_graph.parse_results)
+        result['dependency_graph'] = dep_graph
+        self._check_cancel()
+        
+        # Find orphaned files
+        self.progress.emit("Identifying orphaned files...")
+        orphaned = dep_graph.get_orphaned_files(cfg.orphan_criteria)
+        result['orphaned_files'] = orphaned
+        
+        # Analyze assets (JS, TS, JSON, CSS orphans)
+        if cfg.enable_asset_analysis:
+            self.progress.emit("Analyzing assets (JS, TS, JSON, CSS)...")
+            dep_graph.asset_analyzer.analyze()
+            result['asset_summary'] = dep_graph.asset_analyzer.get_asset_summary()
+            self._check_cancel()
+        
+        # Analyze CSS conflicts and overlaps
+        if cfg.enable_css_analysis:
+            self.progress.emit("Analyzing CSS conflicts...")
+            css_files = {
+                fi.relative_path_str: fi.path
+                for fi in scanner.files_by_ext.get('.css', ())
+            }
+            if css_files:
+                dep_graph.css_analyzer.analyze_css_files(css_files, max_workers=os.cpu_count())
+                dep_graph.css_analyzer.find_conflicts()
+                
+                # Analyze page CSS usage
+                pages = [fi for ext in PAGE_EXTENSIONS for fi in scanner.files_by_ext.get(ext, ())]
+                total = len(pages)
+                for done, fi in enumerate(pages, 1):
+                    dep_graph.css_analyzer.scan_page_css_usage(fi.path, fi.relative_path_str)
+                    if done % self.PROGRESS_EVERY == 0:
+                        self._check_cancel()
+                        self._emit_throttled(f"CSS usage: {done}/{total}")
+                if total:
+                    self.progress.emit(f"CSS usage: {total}/{total}")
+                
+                result['css_stats'] = dep_graph.css_analyzer.get_statistics()
+
+
+class BackupWorker(QThread):
+    """Worker thread for creating and restoring backup archives."""
+    
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, backup_manager, action: str, ignore_patterns=None, backup_path: Path = None):
+        super().__init__()
+        self.backup_manager = backup_manager
+        self.action = action  # 'create' or 'restore'
+        self.ignore_patterns = ignore_patterns
+        self.backup_path = backup_path
+    
+    def run(self):
+        """Run the archive operation."""
+        try:
+            if self.action == 'create':
+                self.progress.emit("Creating backup...")
+                backup_path = self.backup_manager.create_backup(self.ignore_patterns)
+                self.finished.emit({
+                    'action': 'create',
+                    'path': backup_path,
+                    'size': backup_path.stat().st_size
+                })
+            else:
+                self.progress.emit(f"Restoring backup: {self.backup_path.name}")
+                if not self.backup_manager.restore_backup(self.backup_path):
+                    raise RuntimeError("Failed to restore backup")
+                self.finished.emit({'action': 'restore', 'path': self.backup_path})
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class SanityCheckWorker(QThread):
+    """Worker thread for pre- and post-deletion sanity checks."""
+    
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, sanity_checker, action: str, files=None):
+        super().__init__()
+        self.sanity_checker = sanity_checker
+        self.action = action  # 'pre' or 'post'
+        self.files = files
+    
+    def run(self):
+        """Run the requested check."""
+        try:
+            if self.action == 'pre':
+                self.finished.emit(self.sanity_checker.pre_deletion_check(self.files))
+            else:
+                self.finished.emit(self.sanity_checker.post_deletion_check())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class CrawlSaveWorker(QThread):
+    """Worker thread for writing crawl results to the database."""
+    
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, db_connector, pages):
+        super().__init__()
+        self.db_connector = db_connector
+        self.pages = pages
+    
+    def run(self):
+        """Create the pages table if needed, then save every page."""
+        try:
+            from OrphanHunter.scanner.site_scanner import SiteScannerDB
+            scanner_db = SiteScannerDB(self.db_connector)
             
-            # Analyze CSS conflicts and overlaps
-            if self.config.get('enable_css_analysis', True):
-                self.progress.emit("Analyzing CSS conflicts...")
-                css_files = {
-                    k: v.path for k, v in scanner.files.items()
-                    if v.extension == '.css'
-                }
-                if css_files:
-                    dep_graph.css_analyzer.analyze_css_files(css_files)
-                    dep_graph.css_analyzer.find_conflicts()
-                    
-                    # Analyze page CSS usage
-                    for file_key, file_info in scanner.files.items():
-                        if file_info.extension in ['.php', '.html', '.htm']:
-                            dep_graph.css_analyzer.scan_page_css_usage(file_info.path, file_key)
-                    
-                    result['css_stats'] = dep_graph.css_analyzer.get_statistics()
+            # Ensure table exists
+            success, message = scanner_db.ensure_table_exists()
+            if not success:
+                raise RuntimeError(message)
             
-            self.progress.emit("Scan complete!")
-            self.finished.emit(result)
+            # Save all pages in batched transactions
+            success, message, saved_count = scanner_db.save_pages_bulk(self.pages)
+            if not success:
+                raise RuntimeError(message)
             
+            self.finished.emit({'saved_count': saved_count})
         except Exception as e:
             self.error.emit(str(e))
 
@@ -155,6 +358,8 @@ class ScanWorker(QThread):
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    CRAWL_LOG_BLOCKS = 5000  # crawl result lines kept on screen
+    
     def __init__(self):
         super().__init__()
         self.config = Config()
@@ -167,7 +372,40 @@ class MainWindow(QMainWindow):
         self.orphaned_files = set()
         self.sql_tables = set()
         self.site_scanner = None
+        self._http_session = None  # shared by crawls so keep-alive connections survive between them
         self.db_connector = None
+        self.scan_worker = None
+        self.backup_worker = None
+        self.sanity_worker = None
+        self.crawl_save_worker = None
+        # Crawl result lines waiting for the next repaint; older lines would be trimmed by the view anyway
+        self._crawl_buffer = deque(maxlen=self.CRAWL_LOG_BLOCKS)
+        self._crawl_stat_cache = {}  # crawl stat label texts currently on screen
+        self._crawl_signals = _CrawlSignals(self)
+        self._crawl_signals.stats_updated.connect(self._on_crawl_stats)
+        # Coalesce crawl repaints to at most 10 per second
+        self._pending_crawl_stats = None
+        self._crawl_repaint_timer = QTimer(self)
+        self._crawl_repaint_timer.setSingleShot(True)
+        self._crawl_repaint_timer.setInterval(100)
+        self._crawl_repaint_timer.timeout.connect(self._apply_crawl_stats)
+        self._crawl_signals.crawl_finished.connect(self._on_crawl_finished)
+        
+        # Debounce detail rendering so fast tree navigation stays responsive
+        self._pending_detail_key = None
+        self._detail_timer = QTimer(self)
+        self._detail_timer.setSingleShot(True)
+        self._detail_timer.timeout.connect(self._render_file_detail)
+        
+        # Batch log output so verbose scans don't reflow the log panes per message
+        self._log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._drain_log_queue)
+        
+        self._have_mysql_connector = self._check_live_db_driver()
+        self._connect_after_driver_install = False  # retry connect_to_database once pip finishes
+        self.driver_install_process = None
         
         self.init_ui()
         self.connect_signals()
@@ -251,6 +489,27 @@ class MainWindow(QMainWindow):
         self.use_live_db.setToolTip("Connect to live MySQL database using config.php credentials")
         dir_layout.addRow("", self.use_live_db)
         
+        # Shown only when the MySQL driver is missing
+        self.driver_info_widget = QWidget()
+        driver_info_layout = QHBoxLayout()
+        driver_info_layout.setContentsMargins(0, 0, 0, 0)
+        self.driver_info_label = QLabel("mysql-connector-python is not installed; live database scans are disabled.")
+        self.driver_info_label.setStyleSheet("color: #b36b00;")
+        driver_info_layout.addWidget(self.driver_info_label)
+        self.install_driver_btn = QPushButton("Install MySQL driver")
+        self.install_driver_btn.clicked.connect(self.install_mysql_driver)
+        driver_info_layout.addWidget(self.install_driver_btn)
+        driver_info_layout.addStretch()
+        self.driver_info_widget.setLayout(driver_info_layout)
+        dir_layout.addRow("", self.driver_info_widget)
+        self.use_live_db.setEnabled(self._have_mysql_connector)
+        self.driver_info_widget.setVisible(not self._have_mysql_connector)
+        
+        # Bypass the on-disk dependency graph cache
+        self.force_full_rescan = QCheckBox("Force full rescan (ignore cached dependency graph and URL scans)")
+        self.force_full_rescan.setToolTip("Re-parse every file instead of only files changed since the last scan")
+        dir_layout.addRow("", self.force_full_rescan)
+        
         dir_group.setLayout(dir_layout)
         layout.addWidget(dir_group)
         
@@ -281,6 +540,14 @@ class MainWindow(QMainWindow):
         orphan_group = QGroupBox("Orphan Detection Criteria")
         orphan_layout = QVBoxLayout()
         
+        self.enable_orphan_analysis = QCheckBox("Analyze orphans and references")
+        self.enable_orphan_analysis.setChecked(True)
+        self.enable_orphan_analysis.setToolTip(
+            "Build the dependency graph. Asset and CSS analysis also need it. "
+            "Turn off for a quick file inventory."
+        )
+        orphan_layout.addWidget(self.enable_orphan_analysis)
+        
         self.criteria_not_in_nav = QCheckBox("Not linked in navigation files")
         self.criteria_not_in_nav.setChecked(True)
         orphan_layout.addWidget(self.criteria_not_in_nav)
@@ -324,6 +591,11 @@ class MainWindow(QMainWindow):
         self.scan_btn.clicked.connect(self.start_scan)
         button_layout.addWidget(self.scan_btn)
         
+        self.stop_scan_btn = QPushButton("Stop")
+        self.stop_scan_btn.clicked.connect(self.stop_scan)
+        self.stop_scan_btn.setEnabled(False)
+        button_layout.addWidget(self.stop_scan_btn)
+        
         self.backup_btn = QPushButton("Create Backup")
         self.backup_btn.clicked.connect(self.create_backup)
         self.backup_btn.setEnabled(False)
@@ -526,6 +798,9 @@ class MainWindow(QMainWindow):
         
         self.site_url_input = QLineEdit()
         self.site_url_input.setPlaceholderText("https://example.com")
+        # Check the URL as the user types so the start button only enables for a usable URL;
+        # no validator, so any input can still be typed or pasted
+        self.site_url_input.textChanged.connect(self._update_crawl_controls)
         scanner_layout.addRow("Website URL:", self.site_url_input)
         
         self.max_pages_input = QSpinBox()
@@ -534,6 +809,13 @@ class MainWindow(QMainWindow):
         self.max_pages_input.setValue(100)
         scanner_layout.addRow("Max Pages:", self.max_pages_input)
         
+        self.max_workers_input = QSpinBox()
+        self.max_workers_input.setMinimum(1)
+        self.max_workers_input.setMaximum(32)
+        self.max_workers_input.setValue(4)
+        self.max_workers_input.setToolTip("Pages fetched concurrently; each worker waits the delay between its requests")
+        scanner_layout.addRow("Workers:", self.max_workers_input)
+        
         self.crawl_delay_input = QSpinBox()
         self.crawl_delay_input.setMinimum(0)
         self.crawl_delay_input.setMaximum(10)
@@ -552,6 +834,7 @@ class MainWindow(QMainWindow):
         
         self.start_crawl_btn = QPushButton("Start Crawling")
         self.start_crawl_btn.clicked.connect(self.start_site_crawl)
+        self.start_crawl_btn.setEnabled(False)
         control_layout.addWidget(self.start_crawl_btn)
         
         self.stop_crawl_btn = QPushButton("Stop")
@@ -563,6 +846,7 @@ class MainWindow(QMainWindow):
         
         # Statistics
         stats_group = QGroupBox("Crawl Statistics")
+        self.crawl_stats_group = stats_group
         stats_layout = QFormLayout()
         
         self.crawl_total_label = QLabel("0")
@@ -584,13 +868,16 @@ class MainWindow(QMainWindow):
         results_group = QGroupBox("Crawl Results")
         results_layout = QVBoxLayout()
         
-        self.crawl_results_text = QTextEdit()
+        self.crawl_results_text = QPlainTextEdit()
         self.crawl_results_text.setReadOnly(True)
+        self.crawl_results_text.setMaximumBlockCount(self.CRAWL_LOG_BLOCKS)
+        self.crawl_results_text.setUndoRedoEnabled(False)
+        self.crawl_results_text.setCenterOnScroll(False)
         results_layout.addWidget(self.crawl_results_text)
         
-        save_results_btn = QPushButton("Save Results to Database")
-        save_results_btn.clicked.connect(self.save_crawl_results)
-        results_layout.addWidget(save_results_btn)
+        self.save_results_btn = QPushButton("Save Results to Database")
+        self.save_results_btn.clicked.connect(self.save_crawl_results)
+        results_layout.addWidget(self.save_results_btn)
         
         results_group.setLayout(results_layout)
         layout.addWidget(results_group)
@@ -603,8 +890,10 @@ class MainWindow(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout()
         
-        self.log_viewer = QTextEdit()
+        self.log_viewer = QPlainTextEdit()
         self.log_viewer.setReadOnly(True)
+        self.log_viewer.setUndoRedoEnabled(False)
+        self.log_viewer.setMaximumBlockCount(LogConsole.MAX_BLOCKS)
         layout.addWidget(self.log_viewer)
         
         button_layout = QHBoxLayout()
@@ -625,43 +914,76 @@ class MainWindow(QMainWindow):
     
     def on_log_message(self, message: str, level: str):
         """Handle log messages."""
-        self.log_console.append_log(message, level)
-        self.log_viewer.append(f"[{level}] {message}")
+        self._log_queue.append((message, level))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _drain_log_queue(self, batch_size: int = 200):
+        """Append queued log messages to both log panes in one edit each."""
+        batch = []
+        while self._log_queue and len(batch) < batch_size:
+            batch.append(self._log_queue.popleft())
+        if not self._log_queue:
+            self._log_timer.stop()
+        if not batch:
+            return
+        
+        self.log_console.append_logs(batch)
+        
+        document = self.log_viewer.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for message, level in batch:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"[{level}] {message}")
+        cursor.endEditBlock()
     
     def on_file_selected(self, file_key: str):
         """Handle file selection in tree."""
-        if not self.scanner:
+        self._pending_detail_key = file_key
+        self._detail_timer.start(50)
+    
+    def _render_file_detail(self):
+        """Render the detail pane for the most recently selected file."""
+        if not self.scanner or not self._pending_detail_key:
             return
         
-        file_info = self.scanner.get_file_by_relative_path(file_key)
+        file_info = self.scanner.get_file_by_relative_path(self._pending_detail_key)
         if not file_info:
             return
         
-        details = []
-        details.append(f"<h3>{file_info.name}</h3>")
-        details.append(f"<b>Path:</b> {file_info.relative_path}<br>")
-        details.append(f"<b>Size:</b> {round(file_info.size/1024, 2)} KB<br>")
-        details.append(f"<b>References:</b> {file_info.reference_count}<br>")
-        details.append(f"<b>Critical:</b> {'Yes' if file_info.is_critical else 'No'}<br>")
-        details.append(f"<b>Navigation:</b> {'Yes' if file_info.is_navigation else 'No'}<br>")
-        
-        if file_info.referenced_by:
-            details.append("<br><b>Referenced by:</b><ul>")
-            for ref in list(file_info.referenced_by)[:10]:
-                details.append(f"<li>{ref}</li>")
-            if len(file_info.referenced_by) > 10:
-                details.append(f"<li>... and {len(file_info.referenced_by) - 10} more</li>")
-            details.append("</ul>")
-        
-        if file_info.references:
-            details.append("<br><b>References:</b><ul>")
-            for ref in list(file_info.references)[:10]:
-                details.append(f"<li>{ref}</li>")
-            if len(file_info.references) > 10:
-                details.append(f"<li>... and {len(file_info.references) - 10} more</li>")
-            details.append("</ul>")
-        
-        self.file_detail_text.setHtml("".join(details))
+        html = (
+            f"<h3>{file_info.name}</h3>"
+            f"<b>Path:</b> {file_info.relative_path}<br>"
+            f"<b>Size:</b> {round(file_info.size/1024, 2)} KB<br>"
+            f"<b>References:</b> {file_info.reference_count}<br>"
+            f"<b>Critical:</b> {'Yes' if file_info.is_critical else 'No'}<br>"
+            f"<b>Navigation:</b> {'Yes' if file_info.is_navigation else 'No'}<br>"
+            f"{self._format_ref_list('Referenced by', file_info.referenced_by)}"
+            f"{self._format_ref_list('References', file_info.references)}"
+        )
+        
+        # Lay out a detached document, then swap it in so the widget reflows once
+        doc = QTextDocument(self.file_detail_text)
+        doc.setDefaultFont(self.file_detail_text.font())
+        doc.setHtml(html)
+        previous = self.file_detail_text.document()
+        owned = previous.parent() is self.file_detail_text
+        self.file_detail_text.setDocument(doc)
+        if owned:
+            previous.deleteLater()
+    
+    def _format_ref_list(self, title: str, refs: set, limit: int = 10) -> str:
+        """Format a truncated HTML list of file references."""
+        if not refs:
+            return ""
+        items = "".join(f"<li>{ref}</li>" for ref in islice(refs, limit))
+        extra = len(refs) - limit
+        if extra > 0:
+            items += f"<li>... and {extra} more</li>"
+        return f"<br><b>{title}:</b><ul>{items}</ul>"
     
     def on_files_checked(self, file_keys: set):
         """Handle file checkbox changes."""
@@ -674,13 +996,15 @@ class MainWindow(QMainWindow):
         self.admin_dir_input.setText(self.config.get('admin_directory', 'admin'))
         self.sql_dump_input.setText(self.config.get('sql_dump_path', ''))
         self.config_php_input.setText(self.config.get('config_php_path', ''))
-        self.use_live_db.setChecked(self.config.get('use_live_database', False))
+        self.use_live_db.setChecked(self._have_mysql_connector and self.config.get('use_live_database', False))
+        self.force_full_rescan.setChecked(self.config.get('force_full_rescan', False))
         
         # Ignore options
         self.ignore_dot_dirs.setChecked(self.config.get('ignore_dot_directories', True))
         blacklist = self.config.get('blacklist_directories', [])
         self.blacklist_dirs_input.setPlainText(', '.join(blacklist))
         
+        self.enable_orphan_analysis.setChecked(self.config.get('enable_orphan_analysis', True))
         criteria = self.config.get('orphan_criteria', {})
         self.criteria_not_in_nav.setChecked(criteria.get('not_in_navigation', True))
         self.criteria_not_included.setChecked(criteria.get('not_included_anywhere', True))
@@ -693,6 +1017,7 @@ class MainWindow(QMainWindow):
         self.config.set('sql_dump_path', self.sql_dump_input.text())
         self.config.set('config_php_path', self.config_php_input.text())
         self.config.set('use_live_database', self.use_live_db.isChecked())
+        self.config.set('force_full_rescan', self.force_full_rescan.isChecked())
         
         # Save ignore options
         self.config.set('ignore_dot_directories', self.ignore_dot_dirs.isChecked())
@@ -708,6 +1033,7 @@ class MainWindow(QMainWindow):
                     blacklist.append(item)
         self.config.set('blacklist_directories', blacklist)
         
+        self.config.set('enable_orphan_analysis', self.enable_orphan_analysis.isChecked())
         criteria = {
             'not_in_navigation': self.criteria_not_in_nav.isChecked(),
             'not_included_anywhere': self.criteria_not_included.isChecked(),
@@ -719,27 +1045,34 @@ class MainWindow(QMainWindow):
         self.logger.info("Configuration saved")
         QMessageBox.information(self, "Success", "Configuration saved successfully!")
     
+    def _open_file_dialog(self, title: str, line_edit: QLineEdit, name_filter: str = None):
+        """Show a non-native, non-blocking file dialog that writes its selection to line_edit.
+        
+        Without name_filter a directory is selected.
+        """
+        dialog = QFileDialog(self, title, line_edit.text())
+        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        if name_filter:
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setNameFilter(name_filter)
+        else:
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        dialog.fileSelected.connect(line_edit.setText)
+        dialog.open()
+    
     def browse_root_directory(self):
         """Browse for root directory."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Root Directory")
-        if directory:
-            self.root_dir_input.setText(directory)
+        self._open_file_dialog("Select Root Directory", self.root_dir_input)
     
     def browse_sql_dump(self):
         """Browse for SQL dump file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select SQL Dump File", "", "SQL Files (*.sql);;All Files (*)"
-        )
-        if file_path:
-            self.sql_dump_input.setText(file_path)
+        self._open_file_dialog("Select SQL Dump File", self.sql_dump_input, "SQL Files (*.sql);;All Files (*)")
     
     def browse_config_php(self):
         """Browse for config.php file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select config.php File", "", "PHP Files (*.php);;All Files (*)"
-        )
-        if file_path:
-            self.config_php_input.setText(file_path)
+        self._open_file_dialog("Select config.php File", self.config_php_input, "PHP Files (*.php);;All Files (*)")
     
     def start_scan(self):
         """Start scanning operation."""
@@ -753,20 +1086,38 @@ class MainWindow(QMainWindow):
         self.status_panel.set_status("Scanning...", "Please wait")
         self.status_panel.show_progress(True)
         self.scan_btn.setEnabled(False)
+        self.stop_scan_btn.setEnabled(True)
         
         self.scan_worker = ScanWorker(root_dir, self.config)
         self.scan_worker.progress.connect(self.on_scan_progress)
         self.scan_worker.finished.connect(self.on_scan_complete)
         self.scan_worker.error.connect(self.on_scan_error)
+        self.scan_worker.cancelled.connect(self.on_scan_cancelled)
         self.scan_worker.start()
     
+    def stop_scan(self):
+        """Request cancellation of the running scan."""
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.scan_worker.cancel()
+            self.stop_scan_btn.setEnabled(False)
+            self.status_panel.set_status("Stopping...", "Waiting for the current step to finish")
+    
+    def on_scan_cancelled(self):
+        """Handle a scan stopped by the user."""
+        self.status_panel.set_status("Scan Stopped", "Scan cancelled by user")
+        self.status_panel.show_progress(False)
+        self.scan_btn.setEnabled(True)
+        self.stop_scan_btn.setEnabled(False)
+        self.logger.warning("Scan cancelled by user")
+    
     def on_scan_progress(self, message: str):
         """Handle scan progress updates."""
         self.logger.info(message)
         self.status_panel.set_status("Scanning...", message)
     
-    def on_scan_complete(self, result: dict):
+    def on_scan_complete(self):
         """Handle scan completion."""
+        result = self.scan_worker.result
         self.scanner = result['scanner']
         self.dependency_graph = result['dependency_graph']
         self.orphaned_files = result['orphaned_files']
@@ -776,53 +1127,55 @@ class MainWindow(QMainWindow):
         root_dir = Path(self.root_dir_input.text())
         self.backup_manager = BackupManager(root_dir)
         self.deletion_manager = DeletionManager(self.scanner, root_dir)
-        self.sanity_checker = SanityChecker(self.scanner, self.dependency_graph)
+        self.sanity_checker = None
+        if self.dependency_graph is not None:
+            from OrphanHunter.operations.sanity_checker import SanityChecker
+            self.sanity_checker = SanityChecker(self.scanner, self.dependency_graph)
+        self.select_orphaned_btn.setEnabled(self.dependency_graph is not None)
         
         # Update UI
-        self.file_tree.populate_tree(self.scanner.files)
-        self.file_tree.highlight_orphaned()
+        with self.file_tree.batch_update():
+            self.file_tree.populate_tree(self.scanner.files)
+            self.file_tree.highlight_orphaned()
         
-        # Count files by extension
-        file_counts = {}
-        for file_info in self.scanner.files.values():
-            ext = file_info.extension
-            file_counts[ext] = file_counts.get(ext, 0) + 1
+        # Counts are accumulated during the scan walk and handed over by the worker
+        scanner_stats = self.scanner.stats
+        file_counts = result['ext_counts']
         
         stats = {
-            'Total Files': len(self.scanner.files),
+            'Total Files': scanner_stats['total_files'],
             'PHP Files': file_counts.get('.php', 0),
             'HTML Files': file_counts.get('.html', 0) + file_counts.get('.htm', 0),
             'JavaScript Files': file_counts.get('.js', 0),
             'TypeScript Files': file_counts.get('.ts', 0),
             'JSON Files': file_counts.get('.json', 0),
             'CSS Files': file_counts.get('.css', 0),
-            'Critical Files': len(self.scanner.critical_files),
-            'Navigation Files': len(self.scanner.navigation_files),
+            'Critical Files': scanner_stats['critical_files'],
+            'Navigation Files': scanner_stats['navigation_files'],
             'Orphaned Files': len(self.orphaned_files),
             'SQL Tables': len(self.sql_tables),
-            'SQL URLs Found': len(self.dependency_graph.sql_urls) if hasattr(self.dependency_graph, 'sql_urls') else 0
+            'SQL URLs Found': len(self.dependency_graph.sql_urls) if self.dependency_graph is not None else 0
         }
         
-        # Add asset analysis stats if available
-        if hasattr(self.dependency_graph, 'asset_analyzer'):
-            asset_summary = self.dependency_graph.asset_analyzer.get_asset_summary()
-            if asset_summary:
-                stats['Orphaned Assets'] = asset_summary['orphaned_assets']
-                if asset_summary['by_type']:
-                    stats['Orphaned CSS'] = asset_summary['by_type'].get('.css', 0)
-                    stats['Orphaned JS'] = asset_summary['by_type'].get('.js', 0)
+        # Add asset analysis stats if available (summaries are built by the worker)
+        asset_summary = result.get('asset_summary')
+        if asset_summary:
+            stats['Orphaned Assets'] = asset_summary['orphaned_assets']
+            if asset_summary['by_type']:
+                stats['Orphaned CSS'] = asset_summary['by_type'].get('.css', 0)
+                stats['Orphaned JS'] = asset_summary['by_type'].get('.js', 0)
         
         # Add CSS analysis stats if available
-        if hasattr(self.dependency_graph, 'css_analyzer'):
-            css_stats = self.dependency_graph.css_analyzer.get_statistics()
-            if css_stats:
-                stats['CSS Conflicts'] = css_stats.get('property_conflicts', 0)
-                stats['Duplicate Selectors'] = css_stats.get('duplicate_selectors', 0)
+        css_stats = result.get('css_stats')
+        if css_stats:
+            stats['CSS Conflicts'] = css_stats.get('property_conflicts', 0)
+            stats['Duplicate Selectors'] = css_stats.get('duplicate_selectors', 0)
         self.stats_widget.update_stats(stats)
         
         self.status_panel.set_status("Scan Complete", f"Found {len(self.scanner.files)} files")
         self.status_panel.show_progress(False)
         self.scan_btn.setEnabled(True)
+        self.stop_scan_btn.setEnabled(False)
         self.backup_btn.setEnabled(True)
         
         self.logger.info(f"Scan complete: {len(self.scanner.files)} files analyzed")
@@ -836,6 +1189,7 @@ class MainWindow(QMainWindow):
         self.status_panel.set_status("Error", error)
         self.status_panel.show_progress(False)
         self.scan_btn.setEnabled(True)
+        self.stop_scan_btn.setEnabled(False)
         self.logger.error(f"Scan error: {error}")
         QMessageBox.critical(self, "Scan Error", f"An error occurred during scanning:\n\n{error}")
     
@@ -853,25 +1207,50 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.status_panel.set_status("Creating backup...", "Please wait")
-            self.logger.info("Creating backup...")
-            
-            try:
-                backup_path = self.backup_manager.create_backup(
-                    self.config.get_ignore_patterns()
-                )
-                self.config.set('last_backup_path', str(backup_path))
-                self.config.save()
-                
-                size_mb = round(backup_path.stat().st_size / (1024 * 1024), 2)
-                self.status_panel.set_status("Backup Created", str(backup_path))
-                self.logger.info(f"Backup created: {backup_path} ({size_mb} MB)")
-                QMessageBox.information(
-                    self, "Backup Created",
-                    f"Backup created successfully!\n\nLocation: {backup_path}\nSize: {size_mb} MB"
-                )
-            except Exception as e:
-                self.logger.error(f"Backup error: {e}")
-                QMessageBox.critical(self, "Backup Error", f"Error creating backup:\n\n{str(e)}")
+            self._start_backup_worker('create', self._on_backup_complete,
+                                      ignore_patterns=self.config.get_ignore_patterns())
+    
+    def _start_backup_worker(self, action: str, on_finished, **kwargs) -> bool:
+        """Run a backup operation in a BackupWorker; on_finished receives its result dict."""
+        if self.backup_worker and self.backup_worker.isRunning():
+            QMessageBox.warning(self, "Busy", "A backup operation is already running")
+            return False
+        
+        self.status_panel.show_progress(True)
+        self.backup_btn.setEnabled(False)
+        self.backup_worker = BackupWorker(self.backup_manager, action, **kwargs)
+        self.backup_worker.progress.connect(self.logger.info)
+        self.backup_worker.finished.connect(on_finished)
+        self.backup_worker.error.connect(self._on_backup_error)
+        self.backup_worker.start()
+        return True
+    
+    def _backup_worker_done(self):
+        """Restore controls after a backup operation ends."""
+        self.status_panel.show_progress(False)
+        self.backup_btn.setEnabled(True)
+    
+    def _on_backup_complete(self, info: dict):
+        """Handle a finished backup started from the Create Backup button."""
+        self._backup_worker_done()
+        backup_path = info['path']
+        self.config.set('last_backup_path', str(backup_path))
+        self.config.save()
+        
+        size_mb = round(info['size'] / (1024 * 1024), 2)
+        self.status_panel.set_status("Backup Created", str(backup_path))
+        self.logger.info(f"Backup created: {backup_path} ({size_mb} MB)")
+        QMessageBox.information(
+            self, "Backup Created",
+            f"Backup created successfully!\n\nLocation: {backup_path}\nSize: {size_mb} MB"
+        )
+    
+    def _on_backup_error(self, error: str):
+        """Handle a failed backup or restore."""
+        self._backup_worker_done()
+        self.status_panel.set_status("Backup Error", error)
+        self.logger.error(f"Backup error: {error}")
+        QMessageBox.critical(self, "Backup Error", f"Backup operation failed:\n\n{error}")
     
     def select_orphaned_files(self):
         """Select all orphaned files in tree."""
@@ -891,100 +1270,166 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Selection", "No files selected for deletion")
             return
         
-        if not self.deletion_manager or not self.sanity_checker:
+        if not self.deletion_manager:
             QMessageBox.warning(self, "Error", "Please run a scan first")
             return
+        if not self._require_reference_analysis():
+            return
         
         # Pre-deletion check
         self.logger.info("Running pre-deletion sanity check...")
-        check = self.sanity_checker.pre_deletion_check(checked)
+        self._start_sanity_worker('pre', lambda check: self._confirm_batch_delete(checked, check), files=checked)
+    
+    def _start_sanity_worker(self, action: str, on_finished, files=None) -> bool:
+        """Run a sanity check in a SanityCheckWorker; on_finished receives its result dict."""
+        if self.sanity_worker and self.sanity_worker.isRunning():
+            QMessageBox.warning(self, "Busy", "A sanity check is already running")
+            return False
         
+        self.status_panel.show_progress(True)
+        self.batch_mode_btn.setEnabled(False)
+        self.sanity_worker = SanityCheckWorker(self.sanity_checker, action, files)
+        self.sanity_worker.finished.connect(on_finished)
+        self.sanity_worker.error.connect(self._on_sanity_error)
+        self.sanity_worker.start()
+        return True
+    
+    def _sanity_worker_done(self):
+        """Restore controls after a sanity check ends."""
+        self.status_panel.show_progress(False)
+        self.batch_mode_btn.setEnabled(True)
+    
+    def _on_sanity_error(self, error: str):
+        """Handle a failed sanity check."""
+        self._sanity_worker_done()
+        self.logger.error(f"Sanity check error: {error}")
+        QMessageBox.critical(self, "Sanity Check Error", f"Sanity check failed:\n\n{error}")
+    
+    def _confirm_batch_delete(self, checked: set, check: dict):
+        """Confirm a batch deletion once the pre-deletion check has finished."""
+        self._sanity_worker_done()
         if not check['safe_to_proceed']:
-            msg = "WARNING: Pre-deletion check failed!\n\n"
-            msg += "Critical Issues:\n" + "\n".join(check['critical'])
-            QMessageBox.critical(self, "Cannot Delete", msg)
+            parts = ["WARNING: Pre-deletion check failed!", "", "Critical Issues:"]
+            parts.extend(check['critical'])
+            QMessageBox.critical(self, "Cannot Delete", "\n".join(parts))
             return
         
         # Show confirmation with warnings
-        msg = f"Delete {len(checked)} files?\n\n"
+        parts = [f"Delete {len(checked)} files?", ""]
         if check['warnings']:
-            msg += "Warnings:\n" + "\n".join(check['warnings'][:5])
+            parts.append("Warnings:")
+            parts.extend(check['warnings'][:5])
             if len(check['warnings']) > 5:
-                msg += f"\n... and {len(check['warnings']) - 5} more warnings"
+                parts.append(f"... and {len(check['warnings']) - 5} more warnings")
         
-        reply = QMessageBox.question(self, "Confirm Deletion", msg, QMessageBox.Yes | QMessageBox.No)
+        reply = QMessageBox.question(self, "Confirm Deletion", "\n".join(parts), QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            # Create backup first
+            # Create backup first; deletion continues once it is written
             self.logger.info("Creating pre-deletion backup...")
-            backup_path = self.backup_manager.create_backup(self.config.get_ignore_patterns())
-            
-            # Perform deletion
-            self.logger.info(f"Deleting {len(checked)} files...")
-            self.deletion_manager.deletion_queue = checked
-            result = self.deletion_manager.execute_deletions()
-            
-            self.logger.info(f"Deletion complete: {result['successful']} successful, {result['failed']} failed")
-            
-            # Post-deletion check
-            post_check = self.sanity_checker.post_deletion_check()
+            self._start_backup_worker(
+                'create', lambda info: self._delete_after_backup(checked, info),
+                ignore_patterns=self.config.get_ignore_patterns()
+            )
+    
+    def _delete_after_backup(self, checked: set, backup_info: dict):
+        """Delete the confirmed files once the pre-deletion backup exists."""
+        self._backup_worker_done()
+        self.logger.info(f"Pre-deletion backup created: {backup_info['path']}")
+        # Perform deletion
+        self.logger.info(f"Deleting {len(checked)} files...")
+        result = self.deletion_manager.delete_files_raw(sorted(checked))
+        
+        self.logger.info(f"Deletion complete: {result['successful']} successful, {result['failed']} failed")
+        
+        # Post-deletion check
+        self._start_sanity_worker('post', lambda post_check: self._report_post_deletion(result, post_check))
+    
+    def _report_post_deletion(self, result: dict, post_check: dict):
+        """Report the post-deletion check and offer a restore if it found problems."""
+        self._sanity_worker_done()
+        if not post_check['all_ok']:
+            msg = f"Deleted {result['successful']} files, but issues detected:\n\n"
+            msg += f"Broken includes: {len(post_check['broken_includes'])}\n"
+            msg += f"Broken links: {len(post_check['broken_links'])}\n\n"
+            msg += "Restore from backup?"
             
-            if not post_check['all_ok']:
-                msg = f"Deleted {result['successful']} files, but issues detected:\n\n"
-                msg += f"Broken includes: {len(post_check['broken_includes'])}\n"
-                msg += f"Broken links: {len(post_check['broken_links'])}\n\n"
-                msg += "Restore from backup?"
-                
-                reply = QMessageBox.question(self, "Issues Detected", msg, QMessageBox.Yes | QMessageBox.No)
-                if reply == QMessageBox.Yes:
-                    self.restore_backup()
-            else:
-                QMessageBox.information(
-                    self, "Success",
-                    f"Successfully deleted {result['successful']} files!\n\nNo issues detected."
-                )
-                # Rescan
-                self.start_scan()
+            reply = QMessageBox.question(self, "Issues Detected", msg, QMessageBox.Yes | QMessageBox.No)
+            if reply == QMessageBox.Yes:
+                self.restore_backup()
+        else:
+            QMessageBox.information(
+                self, "Success",
+                f"Successfully deleted {result['successful']} files!\n\nNo issues detected."
+            )
+            # Rescan
+            self.start_scan()
     
     def individual_delete(self):
-        """Perform individual deletion with confirmations."""
-        checked = list(self.file_tree.get_checked_files())
+        """Perform individual deletion, confirming all files in one dialog."""
+        checked = sorted(self.file_tree.get_checked_files())
         if not checked:
             QMessageBox.warning(self, "No Selection", "No files selected for deletion")
             return
         
-        QMessageBox.information(
-            self, "Individual Delete",
-            f"Will process {len(checked)} files one by one.\n\nClick OK to start."
+        if not self.deletion_manager:
+            QMessageBox.warning(self, "Error", "Please run a scan first")
+            return
+        
+        files = self.scanner.files
+        infos = {file_key: files.get(file_key) for file_key in checked}
+        confirmed = self._confirm_individual_files(
+            {file_key: info for file_key, info in infos.items() if info}
         )
+        if not confirmed:
+            return
         
-        deleted_count = 0
-        for file_key in checked:
-            file_info = self.scanner.get_file_by_relative_path(file_key)
-            if not file_info:
-                continue
-            
-            msg = f"Delete this file?\n\n{file_key}\n\nSize: {round(file_info.size/1024, 2)} KB"
-            reply = QMessageBox.question(
-                self, "Delete File",
-                msg,
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-            )
-            
-            if reply == QMessageBox.Cancel:
-                break
-            elif reply == QMessageBox.Yes:
-                if self.deletion_manager.delete_file(file_key):
-                    deleted_count += 1
-                    self.logger.info(f"Deleted: {file_key}")
-        
-        if deleted_count > 0:
+        result = self.deletion_manager.delete_files_raw(confirmed)
+        self.logger.info(f"Deletion complete: {result['successful']} successful, {result['failed']} failed")
+        
+        if result['successful'] > 0:
             QMessageBox.information(
                 self, "Complete",
-                f"Deleted {deleted_count} file(s)"
+                f"Deleted {result['successful']} file(s)"
             )
             self.start_scan()
     
+    def _confirm_individual_files(self, infos: dict) -> list:
+        """Show one dialog listing files with checkboxes; return the keys left checked."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Delete Files")
+        dialog.resize(600, 400)
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Uncheck any file you want to keep:"))
+        
+        file_list = QListWidget()
+        file_list.setUniformItemSizes(True)
+        file_list.setUpdatesEnabled(False)
+        for file_key, file_info in infos.items():
+            item = QListWidgetItem(f"{file_key}  ({round(file_info.size/1024, 2)} KB)")
+            item.setData(Qt.UserRole, file_key)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            file_list.addItem(item)
+        file_list.setUpdatesEnabled(True)
+        layout.addWidget(file_list)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("Delete Checked")
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        dialog.setLayout(layout)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return []
+        
+        return [
+            file_list.item(row).data(Qt.UserRole)
+            for row in range(file_list.count())
+            if file_list.item(row).checkState() == Qt.Checked
+        ]
+    
     def restore_backup(self):
         """Restore from backup."""
         if not self.backup_manager:
@@ -1003,13 +1448,15 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.logger.info(f"Restoring backup: {latest['name']}")
-            if self.backup_manager.restore_backup(latest['path']):
-                self.logger.info("Backup restored successfully")
-                QMessageBox.information(self, "Success", "Backup restored successfully!")
-                self.start_scan()
-            else:
-                self.logger.error("Backup restoration failed")
-                QMessageBox.critical(self, "Error", "Failed to restore backup")
+            self.status_panel.set_status("Restoring backup...", latest['name'])
+            self._start_backup_worker('restore', self._on_restore_complete, backup_path=latest['path'])
+    
+    def _on_restore_complete(self, info: dict):
+        """Handle a finished restore."""
+        self._backup_worker_done()
+        self.logger.info("Backup restored successfully")
+        QMessageBox.information(self, "Success", "Backup restored successfully!")
+        self.start_scan()
     
     def list_backups(self):
         """List all available backups."""
@@ -1022,14 +1469,18 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "No Backups", "No backup archives found")
             return
         
-        msg = "Available Backups:\n\n"
-        for backup in backups[:10]:
-            msg += f"{backup['name']}\n  Date: {backup['date_str']}, Size: {backup['size_mb']} MB\n\n"
-        
-        if len(backups) > 10:
-            msg += f"... and {len(backups) - 10} more"
-        
-        QMessageBox.information(self, "Backups", msg)
+        BackupListDialog(backups, self).exec_()
+    
+    def _require_reference_analysis(self) -> bool:
+        """Return True if the last scan built the dependency graph, otherwise explain why not."""
+        if self.dependency_graph is not None:
+            return True
+        QMessageBox.warning(
+            self, "Reference Analysis Disabled",
+            "This feature needs the dependency graph, which was skipped in the last scan.\n\n"
+            "Enable \"Analyze orphans and references\" on the Configuration tab and run the scan again."
+        )
+        return False
     
     def generate_sitemap(self):
         """Generate sitemap.xml."""
@@ -1045,6 +1496,7 @@ class MainWindow(QMainWindow):
         root_dir = Path(self.root_dir_input.text())
         output_path = root_dir / "sitemap.xml"
         
+        from OrphanHunter.generators.sitemap_generator import SitemapGenerator
         generator = SitemapGenerator(self.scanner, base_url)
         generator.generate_sitemap(output_path)
         
@@ -1057,13 +1509,16 @@ class MainWindow(QMainWindow):
     
     def generate_tree_map(self):
         """Generate system tree map."""
-        if not self.scanner or not self.dependency_graph:
+        if not self.scanner:
             QMessageBox.warning(self, "Error", "Please run a scan first")
             return
+        if not self._require_reference_analysis():
+            return
         
         root_dir = Path(self.root_dir_input.text())
         output_path = root_dir / "system-tree-map.md"
         
+        from OrphanHunter.generators.markdown_generator import MarkdownGenerator
         generator = MarkdownGenerator(self.scanner, self.dependency_graph)
         generator.generate_tree_map(output_path)
         
@@ -1072,13 +1527,16 @@ class MainWindow(QMainWindow):
     
     def generate_navigation_map(self):
         """Generate navigation map."""
-        if not self.scanner or not self.dependency_graph:
+        if not self.scanner:
             QMessageBox.warning(self, "Error", "Please run a scan first")
             return
+        if not self._require_reference_analysis():
+            return
         
         root_dir = Path(self.root_dir_input.text())
         output_path = root_dir / "navigation-map.md"
         
+        from OrphanHunter.generators.markdown_generator import MarkdownGenerator
         generator = MarkdownGenerator(self.scanner, self.dependency_graph)
         generator.generate_navigation_map(output_path)
         
@@ -1094,9 +1552,11 @@ class MainWindow(QMainWindow):
     
     def generate_style_report(self):
         """Generate style error report."""
-        if not self.scanner or not self.dependency_graph:
+        if not self.scanner:
             QMessageBox.warning(self, "Error", "Please run a scan first")
             return
+        if not self._require_reference_analysis():
+            return
         
         root_dir = Path(self.root_dir_input.text())
         output_path = root_dir / "style-error-report.md"
@@ -1132,9 +1592,76 @@ class MainWindow(QMainWindow):
             return
         
         # Create and show URL migration window
+        from OrphanHunter.gui.url_migration_window import URLMigrationWindow
         migration_window = URLMigrationWindow(self.config, self)
         migration_window.exec_()
     
+    def _check_live_db_driver(self) -> bool:
+        """Check once whether the MySQL driver is importable."""
+        try:
+            return importlib.util.find_spec('mysql.connector') is not None
+        except ModuleNotFoundError:
+            return False
+    
+    def install_mysql_driver(self):
+        """Install the MySQL driver with pip in a QProcess, streaming output to the log."""
+        if self.driver_install_process and self.driver_install_process.state() != QProcess.NotRunning:
+            return
+        
+        self.install_driver_btn.setEnabled(False)
+        self.driver_info_label.setText("Installing mysql-connector-python...")
+        
+        args = ['-m', 'pip', 'install']
+        if sys.prefix == sys.base_prefix:
+            # --user is rejected inside virtual environments
+            args.append('--user')
+        args.append('mysql-connector-python')
+        
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.MergedChannels)
+        process.readyReadStandardOutput.connect(self._on_driver_install_output)
+        process.finished.connect(self.on_driver_install_finished)
+        process.errorOccurred.connect(self._on_driver_install_error)
+        self.driver_install_process = process
+        process.start(sys.executable, args)
+    
+    def _on_driver_install_output(self):
+        """Forward pip output to the log panes."""
+        output = bytes(self.driver_install_process.readAllStandardOutput()).decode('utf-8', errors='replace')
+        for line in output.splitlines():
+            if line.strip():
+                self.logger.info(f"pip: {line}")
+    
+    def _on_driver_install_error(self, error):
+        """Handle pip failing to start."""
+        if error == QProcess.FailedToStart:
+            self.on_driver_install_finished(-1, QProcess.CrashExit)
+    
+    def on_driver_install_finished(self, exit_code: int, exit_status):
+        """Re-check the driver after pip finishes."""
+        importlib.invalidate_caches()
+        self._have_mysql_connector = self._check_live_db_driver()
+        self.use_live_db.setEnabled(self._have_mysql_connector)
+        self.driver_info_widget.setVisible(not self._have_mysql_connector)
+        self.install_driver_btn.setEnabled(True)
+        
+        connect_pending = self._connect_after_driver_install
+        self._connect_after_driver_install = False
+        
+        if self._have_mysql_connector:
+            self.logger.info("mysql-connector-python installed")
+            if connect_pending:
+                self.connect_to_database()
+        elif exit_code == 0 and exit_status == QProcess.NormalExit:
+            # A fresh --user site directory is only picked up on restart
+            message = "mysql-connector-python installed; restart to enable live database scans."
+            self.driver_info_label.setText(message)
+            self.logger.info(message)
+        else:
+            message = f"Installation failed (pip exit code {exit_code})"
+            self.driver_info_label.setText(message)
+            self.logger.error(message)
+    
     def connect_to_database(self):
         """Connect to database for site scanner."""
         config_php = self.config_php_input.text()
@@ -1142,6 +1669,18 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please set config.php path in Config tab first")
             return
         
+        # Driver availability is checked once at startup and after installs
+        if not self._have_mysql_connector:
+            reply = QMessageBox.question(
+                self, "Driver Not Installed",
+                "mysql-connector-python is required. Install it now and connect when done?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                self._connect_after_driver_install = True
+                self.install_mysql_driver()
+            return
+        
         try:
             from OrphanHunter.analyzer.live_db_connector import ConfigParser
             
@@ -1155,6 +1694,7 @@ class MainWindow(QMainWindow):
                 return
             
             # Create connector
+            from OrphanHunter.analyzer.live_db_connector import LiveDatabaseConnector
             self.db_connector = LiveDatabaseConnector()
             success, msg = self.db_connector.connect(credentials)
             
@@ -1175,19 +1715,10 @@ class MainWindow(QMainWindow):
                 self.db_connector = None
         
         except ImportError:
-            reply = QMessageBox.question(
-                self, "Install Required Package",
-                "mysql-connector-python is required. Install now?",
-                QMessageBox.Yes | QMessageBox.No
+            QMessageBox.warning(
+                self, "Driver Not Installed",
+                "mysql-connector-python is required. Use \"Install MySQL driver\" on the Config tab."
             )
-            
-            if reply == QMessageBox.Yes:
-                import subprocess
-                try:
-                    subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'mysql-connector-python'])
-                    QMessageBox.information(self, "Success", "Package installed. Please try connecting again.")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Installation failed: {e}")
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Connection error: {e}")
@@ -1220,83 +1751,118 @@ class MainWindow(QMainWindow):
     
     def start_site_crawl(self):
         """Start crawling website."""
-        url = self.site_url_input.text().strip()
-        if not url:
-            QMessageBox.warning(self, "Error", "Please enter a website URL")
+        if not self._crawl_url_valid():
             return
-        
+        url = self.site_url_input.text().strip()
         max_pages = self.max_pages_input.value()
         
         # Create scanner
-        self.site_scanner = SiteScanner(url, max_pages)
+        from OrphanHunter.scanner.site_scanner import SiteScanner
+        if self._http_session is None:
+            self._http_session = SiteScanner.create_session(pool_size=self.max_workers_input.maximum())
+        self.site_scanner = SiteScanner(url, max_pages, session=self._http_session)
         self.site_scanner.delay_between_requests = self.crawl_delay_input.value()
         self.site_scanner.follow_external = self.follow_external_checkbox.isChecked()
+        self.site_scanner.max_workers = self.max_workers_input.value()
         
         # Clear results
+        self._crawl_buffer.clear()
         self.crawl_results_text.clear()
         
-        # Update UI
-        self.start_crawl_btn.setEnabled(False)
-        self.stop_crawl_btn.setEnabled(True)
-        
-        # Start crawling
+        # Start crawling; stats arrive as coalesced signals instead of a polling timer
+        self.site_scanner.stats_callback = self._crawl_signals.stats_updated.emit
         self.site_scanner.start_crawl(self.crawl_callback)
+        self._update_crawl_controls()
         self.logger.info(f"Started crawling: {url}")
-        
-        # Start update timer
-        from PyQt5.QtCore import QTimer
-        self.crawl_update_timer = QTimer()
-        self.crawl_update_timer.timeout.connect(self.update_crawl_stats)
-        self.crawl_update_timer.start(1000)  # Update every second
+    
+    def _crawl_url_valid(self) -> bool:
+        """Return True if the URL field holds something with a host to crawl."""
+        text = self.site_url_input.text().strip()
+        if not text:
+            return False
+        url = QUrl.fromUserInput(text)
+        return url.isValid() and bool(url.host())
+    
+    def _update_crawl_controls(self):
+        """Derive the Start/Stop button states from the URL field and the crawler."""
+        crawling = self.site_scanner is not None and self.site_scanner.crawling
+        self.start_crawl_btn.setEnabled(self._crawl_url_valid() and not crawling)
+        self.stop_crawl_btn.setEnabled(crawling and not self.site_scanner.stopping)
     
     def stop_site_crawl(self):
         """Stop the crawling process."""
         if self.site_scanner:
+            # Completion is reported through crawl_finished once in-flight pages are done
             self.site_scanner.stop_crawl()
-            self.start_crawl_btn.setEnabled(True)
-            self.stop_crawl_btn.setEnabled(False)
+            self._update_crawl_controls()
             
-            if hasattr(self, 'crawl_update_timer'):
-                self.crawl_update_timer.stop()
-            
-            self.logger.info("Crawling stopped")
+            self.logger.info("Stopping crawl...")
     
     def crawl_callback(self, event_type, data):
-        """Callback for crawl events."""
+        """Callback for crawl events (runs on the crawl thread)."""
         if event_type == 'page_crawled':
             page = data
             status = "✓" if page.status_code == 200 else "✗"
-            self.crawl_results_text.append(
+            self._crawl_buffer.append(
                 f"{status} [{page.status_code}] {page.url}\n"
                 f"   Title: {page.title or 'N/A'}\n"
             )
         elif event_type == 'crawl_complete':
-            self.start_crawl_btn.setEnabled(True)
-            self.stop_crawl_btn.setEnabled(False)
-            
-            if hasattr(self, 'crawl_update_timer'):
-                self.crawl_update_timer.stop()
-            
-            self.update_crawl_stats()
-            self.logger.info(f"Crawling complete: {data['total_pages']} pages")
-            
-            QMessageBox.information(
-                self, "Crawl Complete",
-                f"Crawled {data['total_pages']} pages\n"
-                f"Successful: {data['successful']}\n"
-                f"Errors: {data['errors']}"
-            )
+            self._crawl_signals.crawl_finished.emit(data)
+    
+    def _on_crawl_finished(self, data: dict):
+        """Handle crawl completion on the GUI thread."""
+        self._update_crawl_controls()
+        
+        self._crawl_repaint_timer.stop()
+        self._apply_crawl_stats()
+        self.logger.info(f"Crawling complete: {data['total_pages']} pages")
+        
+        QMessageBox.information(
+            self, "Crawl Complete",
+            f"Crawled {data['total_pages']} pages\n"
+            f"Successful: {data['successful']}\n"
+            f"Errors: {data['errors']}"
+        )
     
-    def update_crawl_stats(self):
-        """Update crawl statistics display."""
-        if not self.site_scanner:
+    def _on_crawl_stats(self, stats: dict):
+        """Keep the latest statistics snapshot and schedule a repaint."""
+        self._pending_crawl_stats = stats
+        if not self._crawl_repaint_timer.isActive():
+            self._crawl_repaint_timer.start()
+    
+    def _apply_crawl_stats(self):
+        """Show buffered result lines and the latest statistics snapshot."""
+        self._flush_crawl_buffer()
+        
+        stats = self._pending_crawl_stats
+        if stats is None:
             return
+        self._pending_crawl_stats = None
         
-        stats = self.site_scanner.get_statistics()
-        self.crawl_total_label.setText(str(stats['total_pages']))
-        self.crawl_success_label.setText(str(stats['successful']))
-        self.crawl_errors_label.setText(str(stats['errors']))
-        self.crawl_avg_time_label.setText(f"{stats['avg_load_time']:.2f}s")
+        # Change all labels with the group's updates off so it relayouts and repaints once
+        self.crawl_stats_group.setUpdatesEnabled(False)
+        try:
+            self._set_crawl_stat(self.crawl_total_label, 'total', str(stats['total_pages']))
+            self._set_crawl_stat(self.crawl_success_label, 'successful', str(stats['successful']))
+            self._set_crawl_stat(self.crawl_errors_label, 'errors', str(stats['errors']))
+            self._set_crawl_stat(self.crawl_avg_time_label, 'avg_time', f"{stats['avg_load_time']:.2f}s")
+        finally:
+            self.crawl_stats_group.setUpdatesEnabled(True)
+    
+    def _set_crawl_stat(self, label: QLabel, key: str, value: str):
+        """Update a crawl stat label only when its text changed."""
+        if self._crawl_stat_cache.get(key) != value:
+            label.setText(value)
+            self._crawl_stat_cache[key] = value
+    
+    def _flush_crawl_buffer(self):
+        """Append buffered crawl result lines in one edit."""
+        lines = []
+        while self._crawl_buffer:
+            lines.append(self._crawl_buffer.popleft())
+        if lines:
+            self.crawl_results_text.appendPlainText("\n".join(lines))
     
     def save_crawl_results(self):
         """Save crawl results to database."""
@@ -1308,30 +1874,36 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please connect to database first")
             return
         
-        try:
-            # Create database handler
-            scanner_db = SiteScannerDB(self.db_connector)
-            
-            # Ensure table exists
-            success, message = scanner_db.ensure_table_exists()
-            if not success:
-                QMessageBox.critical(self, "Error", message)
-                return
-            
-            # Save all pages
-            saved_count = 0
-            for page in self.site_scanner.get_all_pages():
-                success, msg = scanner_db.save_page(page)
-                if success:
-                    saved_count += 1
-            
-            QMessageBox.information(
-                self, "Success",
-                f"Saved {saved_count} pages to database"
-            )
-            self.logger.info(f"Saved {saved_count} crawl results to database")
+        if self.crawl_save_worker and self.crawl_save_worker.isRunning():
+            return
         
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save results: {e}")
-            self.logger.error(f"Error saving crawl results: {e}")
+        # Table creation and the inserts are database round-trips; keep them off the GUI thread
+        self.save_results_btn.setEnabled(False)
+        self.crawl_save_worker = CrawlSaveWorker(self.db_connector, self.site_scanner.get_all_pages())
+        self.crawl_save_worker.finished.connect(self.on_crawl_save_finished)
+        self.crawl_save_worker.error.connect(self.on_crawl_save_error)
+        self.crawl_save_worker.start()
+    
+    def on_crawl_save_finished(self, result: dict):
+        """Handle saved crawl results."""
+        self.save_results_btn.setEnabled(True)
+        saved_count = result['saved_count']
+        QMessageBox.information(
+            self, "Success",
+            f"Saved {saved_count} pages to database"
+        )
+        self.logger.info(f"Saved {saved_count} crawl results to database")
+    
+    def on_crawl_save_error(self, error: str):
+        """Handle a failed crawl result save."""
+        self.save_results_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save results: {error}")
+        self.logger.error(f"Error saving crawl results: {error}")
 
+    
+    def closeEvent(self, event):
+        """Release the shared HTTP session when the window closes."""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+        super().closeEvent(event)
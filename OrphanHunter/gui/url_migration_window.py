@@ -1,20 +1,25 @@
 """URL Migration Window - comprehensive URL replacement tool."""
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QProgressBar,
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QProgressBar,
     QTableWidget, QTableWidgetItem, QTextEdit, QGroupBox, QComboBox,
     QCheckBox, QLineEdit, QSplitter, QMessageBox, QHeaderView, QFileDialog,
-    QListWidget, QListWidgetItem, QRadioButton, QButtonGroup, QTabWidget,
-    QFormLayout, QSpinBox, QDialogButtonBox
+    QListWidget, QRadioButton, QButtonGroup, QTabWidget,
+    QFormLayout, QSpinBox, QDialogButtonBox, QTableView, QAbstractItemView
+)
+from PyQt5.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, pyqtSlot, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QColor, QFont
 
 from OrphanHunter.utils.config import Config
 from OrphanHunter.utils.url_config import URLConfig
 from OrphanHunter.analyzer.url_analyzer import URLAnalyzer, URLInstance
+from OrphanHunter.analyzer.url_scan_cache import URLScanCache
 from OrphanHunter.operations.url_migrator import URLMigrator, ChangeRecord
 from OrphanHunter.operations.backup_manager import BackupManager
 
@@ -37,9 +42,14 @@ class URLScanWorker(QThread):
         try:
             result = {}
             
-            # Get all internal domains
+            # Snapshot settings once; the dialog may edit the live lists while this runs
             internal_domains = self.url_config.get_all_internal_domains()
-            external_whitelist = self.url_config.get("external_whitelist", [])
+            external_whitelist = list(self.url_config.get("external_whitelist", []))
+            file_types = list(self.url_config.get_enabled_file_types())
+            ignore_patterns = list(self.config.get_ignore_patterns())
+            ignore_dot_directories = self.config.should_ignore_dot_directories()
+            config_php = self.config.get("config_php_path")
+            config_php_path = Path(config_php) if config_php else None
             
             self.progress.emit(f"Scanning for URLs (domains: {', '.join(internal_domains) or 'none configured'})...")
             
@@ -48,31 +58,36 @@ class URLScanWorker(QThread):
             
             # Detect helper functions from config files
             config_files = []
-            if self.config.get("config_php_path"):
-                config_files.append(Path(self.config.get("config_php_path")))
+            if config_php_path:
+                config_files.append(config_php_path)
             
-            # Look for header.php
-            header_paths = list(self.root_dir.rglob("header.php"))
-            config_files.extend(header_paths[:3])  # Check first 3 matches
+            # Look for header.php (first 3 matches, shallowest first)
+            config_files.extend(analyzer.find_files_named(
+                self.root_dir, "header.php", 3, ignore_patterns, ignore_dot_directories
+            ))
             
             self.progress.emit("Detecting URL helper functions...")
             helpers = analyzer.detect_helper_functions(config_files)
             result['helpers'] = helpers
             
             # Extract domains from config if not already set
-            if not internal_domains and self.config.get("config_php_path"):
+            if not internal_domains and config_php_path:
                 self.progress.emit("Extracting domains from config.php...")
-                extracted_domains = analyzer.extract_domain_from_config(
-                    Path(self.config.get("config_php_path"))
-                )
+                extracted_domains = analyzer.extract_domain_from_config(config_php_path)
                 result['extracted_domains'] = extracted_domains
             
-            # Scan all files
-            file_types = self.url_config.get_enabled_file_types()
-            ignore_patterns = self.config.get_ignore_patterns()
+            # Reuse results for files unchanged since the last scan; domain edits only reclassify
+            scan_cache = URLScanCache(self.root_dir)
+            cached_results = {}
+            if not self.config.get("force_full_rescan", False):
+                cached_results = scan_cache.load(analyzer.cache_settings())
             
             self.progress.emit(f"Scanning files ({', '.join(file_types)})...")
-            url_instances = analyzer.scan_directory(self.root_dir, file_types, ignore_patterns)
+            url_instances = analyzer.scan_directory(self.root_dir, file_types, ignore_patterns,
+                                                    max_workers=os.cpu_count(),
+                                                    cached_results=cached_results)
+            if analyzer.results_changed:
+                scan_cache.save(analyzer.cache_settings(), analyzer.file_results)
             result['url_instances'] = url_instances
             
             # Verify classifications (second pass)
@@ -86,8 +101,193 @@ class URLScanWorker(QThread):
             self.finished.emit(result)
             
         except Exception as e:
-            import traceback
-            self.error.emit(f"{str(e)}\n{traceback.format_exc()}")
+            # Formatting the stack is only worth it when debugging
+            if self.config.get("debug", False):
+                import traceback
+                self.error.emit(f"{str(e)}\n{traceback.format_exc()}")
+            else:
+                self.error.emit(str(e))
+
+
+class BackupSizeWorker(QThread):
+    """Worker thread that totals file sizes under the root directory."""
+    
+    finished = pyqtSignal(object)  # total bytes; object so sizes over 2 GB survive
+    
+    def __init__(self, root_dir):
+        super().__init__()
+        self.root_dir = str(root_dir)
+    
+    def run(self):
+        """Walk the tree with os.scandir and emit the total size in bytes."""
+        total_size = 0
+        pending = [self.root_dir]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                except OSError:
+                    continue
+        
+        self.finished.emit(total_size)
+
+
+class MigrationApplyWorker(QThread):
+    """Worker thread that applies and verifies planned URL replacements."""
+    
+    progress = pyqtSignal(int, int)  # current file, total files
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, migrator, records, root_dir):
+        super().__init__()
+        self.migrator = migrator
+        self.records = records
+        self.root_dir = root_dir
+    
+    def run(self):
+        """Apply the changes, then verify them against the files on disk."""
+        last_progress = -1
+        
+        def progress_callback(current, total):
+            # Only signal when the percentage moves; large migrations report every file
+            nonlocal last_progress
+            progress = int((current / total) * 100)
+            if progress == last_progress and current != total:
+                return
+            last_progress = progress
+            self.progress.emit(current, total)
+        
+        try:
+            results = self.migrator.apply_changes(self.records, progress_callback)
+            verification = self.migrator.verify_changes(self.root_dir)
+            self.finished.emit({'results': results, 'verification': verification})
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ChangeRecordsModel(QAbstractTableModel):
+    """Table model over planned ChangeRecords with a checkable Include column."""
+    
+    HEADERS = ["Include", "File", "Line", "Old URL", "New Format", "Context"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+        self.rows = []      # precomputed display strings per record
+        self.search_keys = []  # lowercase file/old/new text per record for filtering
+        self.checked = bytearray()  # include flag (0/1) per record
+        self._selected = None  # cached selected_records() result, reset on any toggle
+    
+    def set_records(self, records):
+        """Replace all records in a single model reset."""
+        self.beginResetModel()
+        self.records = list(records)
+        self.rows = []
+        for record in self.records:
+            context = record.old_line[:30] + "..." if len(record.old_line) > 30 else record.old_line
+            self.rows.append((
+                "",
+                str(record.file_path),
+                str(record.line_number),
+                record.old_url[:40],
+                record.new_url[:40],
+                context
+            ))
+        self.search_keys = ["\n".join((row[1], row[3], row[4])).lower() for row in self.rows]
+        self.checked = bytearray(b'\x01') * len(self.records)
+        self._selected = None
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of change records."""
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return column titles."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return cell text, or the include state for column 0."""
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole and index.column() > 0:
+            return self.rows[index.row()][index.column()]
+        if role == Qt.CheckStateRole and index.column() == 0:
+            return Qt.Checked if self.checked[index.row()] else Qt.Unchecked
+        return None
+    
+    def flags(self, index):
+        """Make the Include column checkable."""
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Toggle a record's include state."""
+        if index.isValid() and index.column() == 0 and role == Qt.CheckStateRole:
+            self.checked[index.row()] = value == Qt.Checked
+            self._selected = None
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+    
+    def set_checked_rows(self, rows, checked: bool):
+        """Set the include state of many rows with one dataChanged signal."""
+        for row in rows:
+            self.checked[row] = checked
+        self._selected = None
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.rows) - 1, 0), [Qt.CheckStateRole])
+    
+    def selected_records(self):
+        """Return the records whose Include box is checked; callers must not modify the list."""
+        if self._selected is None:
+            self._selected = [record for record, checked in zip(self.records, self.checked) if checked]
+        return self._selected
+    
+    def row_matches(self, row: int, text: str) -> bool:
+        """Check whether the file, old URL or new URL column contains text (lowercase)."""
+        return text in self.search_keys[row]
+
+
+class ChangeRecordsFilterModel(QSortFilterProxyModel):
+    """Proxy that shows only change records matching the filter text."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_text = ""
+        # The filter only depends on the text, not on Include toggles
+        self.setDynamicSortFilter(False)
+    
+    def set_filter_text(self, text: str):
+        """Re-filter rows for a new filter string."""
+        self.filter_text = text.lower()
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Accept rows whose file, old URL or new URL contains the filter text."""
+        return not self.filter_text or self.sourceModel().row_matches(source_row, self.filter_text)
+    
+    def source_rows(self):
+        """Return the source rows currently shown."""
+        return [self.mapToSource(self.index(row, 0)).row() for row in range(self.rowCount())]
 
 
 class URLMigrationWindow(QDialog):
@@ -106,6 +306,8 @@ class URLMigrationWindow(QDialog):
         self.change_records = []
         self.selected_records = []
         self.backup_path = None
+        self.size_worker = None
+        self.apply_worker = None
         
         self.current_step = 0
         self.steps = [
@@ -150,29 +352,19 @@ class URLMigrationWindow(QDialog):
         self.step1_widget = self.create_step1_configure()
         self.tab_widget.addTab(self.step1_widget, "1. Configure & Scan")
         
-        # Step 2: Verify Results
-        self.step2_widget = self.create_step2_verify()
-        self.tab_widget.addTab(self.step2_widget, "2. Verify Results")
-        
-        # Step 3: Review Changes
-        self.step3_widget = self.create_step3_review()
-        self.tab_widget.addTab(self.step3_widget, "3. Review Changes")
-        
-        # Step 4: Backup
-        self.step4_widget = self.create_step4_backup()
-        self.tab_widget.addTab(self.step4_widget, "4. Create Backup")
-        
-        # Step 5: Final Approval
-        self.step5_widget = self.create_step5_approval()
-        self.tab_widget.addTab(self.step5_widget, "5. Final Approval")
-        
-        # Step 6: Apply Changes
-        self.step6_widget = self.create_step6_apply()
-        self.tab_widget.addTab(self.step6_widget, "6. Apply Changes")
-        
-        # Step 7: Rollback
-        self.step7_widget = self.create_step7_rollback()
-        self.tab_widget.addTab(self.step7_widget, "7. Rollback Options")
+        # Later steps start as placeholders and are built the first time they are needed
+        self._step_builders = [
+            None,
+            self.create_step2_verify,
+            self.create_step3_review,
+            self.create_step4_backup,
+            self.create_step5_approval,
+            self.create_step6_apply,
+            self.create_step7_rollback
+        ]
+        self._built_steps = {0}
+        for index, name in enumerate(self.steps[1:], start=1):
+            self.tab_widget.addTab(QWidget(), f"{index + 1}. {name}")
         
         # Disable tabs initially
         for i in range(1, 7):
@@ -201,6 +393,25 @@ class URLMigrationWindow(QDialog):
         
         self.update_step_display()
     
+    def _ensure_step_built(self, index: int):
+        """Build a step's widgets and swap them in for its placeholder tab."""
+        if index in self._built_steps:
+            return
+        self._built_steps.add(index)
+        
+        widget = self._step_builders[index]()
+        setattr(self, f"step{index + 1}_widget", widget)
+        
+        placeholder = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+        enabled = self.tab_widget.isTabEnabled(index)
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setTabEnabled(index, enabled)
+        self.tab_widget.setCurrentIndex(current)
+        placeholder.deleteLater()
+    
     def create_step1_configure(self):
         """Step 1: Configuration and initial scan."""
         widget = QGroupBox("Configuration")
@@ -355,7 +566,12 @@ class URLMigrationWindow(QDialog):
         filter_layout.addWidget(QLabel("Filter:"))
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter by file, URL, or path...")
-        self.filter_input.textChanged.connect(self.filter_changes)
+        # Debounce typing so a word re-filters the table once, not once per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.filter_changes(self.filter_input.text()))
+        self.filter_input.textChanged.connect(lambda _text: self._filter_timer.start())
         filter_layout.addWidget(self.filter_input)
         
         self.select_all_btn = QPushButton("Select All")
@@ -368,15 +584,20 @@ class URLMigrationWindow(QDialog):
         
         layout.addLayout(filter_layout)
         
-        # Changes table
-        self.changes_table = QTableWidget()
-        self.changes_table.setColumnCount(6)
-        self.changes_table.setHorizontalHeaderLabels([
-            "Include", "File", "Line", "Old URL", "New Format", "Context"
-        ])
+        # Changes table; the view only renders visible rows of the model
+        self.changes_model = ChangeRecordsModel(self)
+        self.changes_filter = ChangeRecordsFilterModel(self)
+        self.changes_filter.setSourceModel(self.changes_model)
+        self.changes_table = QTableView()
+        self.changes_table.setModel(self.changes_filter)
+        # Fixed starting widths; nothing measures cell contents on repopulation
         self.changes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-        self.changes_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.changes_table.itemSelectionChanged.connect(self.on_change_selected)
+        self.changes_table.horizontalHeader().setStretchLastSection(True)
+        for column, width in enumerate((60, 260, 50, 260, 260)):
+            self.changes_table.setColumnWidth(column, width)
+        self.changes_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.changes_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.changes_table.selectionModel().currentRowChanged.connect(self.on_change_selected)
         layout.addWidget(self.changes_table)
         
         # Context viewer
@@ -542,6 +763,7 @@ class URLMigrationWindow(QDialog):
         """Move to next step."""
         if self.current_step < len(self.steps) - 1:
             self.current_step += 1
+            self._ensure_step_built(self.current_step)
             self.tab_widget.setTabEnabled(self.current_step, True)
             self.update_step_display()
             
@@ -565,12 +787,10 @@ class URLMigrationWindow(QDialog):
         """Load configuration into UI elements."""
         # Load domains
         self.domain_list.clear()
-        for domain in self.url_config.get("internal_domains", []):
-            self.domain_list.addItem(domain)
+        self.domain_list.addItems(self.url_config.get("internal_domains", []))
         
         self.legacy_list.clear()
-        for domain in self.url_config.get("legacy_domains", []):
-            self.legacy_list.addItem(domain)
+        self.legacy_list.addItems(self.url_config.get("legacy_domains", []))
         
         # Load format
         format_map = {
@@ -588,12 +808,7 @@ class URLMigrationWindow(QDialog):
     
     def save_config_from_ui(self):
         """Save configuration from UI elements."""
-        # Save domains
-        domains = [self.domain_list.item(i).text() for i in range(self.domain_list.count())]
-        self.url_config.set("internal_domains", domains)
-        
-        legacy = [self.legacy_list.item(i).text() for i in range(self.legacy_list.count())]
-        self.url_config.set("legacy_domains", legacy)
+        # Domains need no copying back: the add/remove handlers update url_config and the lists together
         
         # Save format
         format_map = {
@@ -627,8 +842,8 @@ class URLMigrationWindow(QDialog):
         from PyQt5.QtWidgets import QInputDialog
         domain, ok = QInputDialog.getText(self, "Add Internal Domain", "Enter domain (e.g., example.com):")
         if ok and domain:
-            self.url_config.add_internal_domain(domain)
-            self.domain_list.addItem(self.url_config._normalize_domain(domain))
+            if self.url_config.add_internal_domain(domain):
+                self.domain_list.addItem(self.url_config._normalize_domain(domain))
     
     def remove_internal_domain(self):
         """Remove selected internal domain."""
@@ -643,8 +858,8 @@ class URLMigrationWindow(QDialog):
         from PyQt5.QtWidgets import QInputDialog
         domain, ok = QInputDialog.getText(self, "Add Legacy Domain", "Enter legacy domain (e.g., old-site.com):")
         if ok and domain:
-            self.url_config.add_legacy_domain(domain)
-            self.legacy_list.addItem(self.url_config._normalize_domain(domain))
+            if self.url_config.add_legacy_domain(domain):
+                self.legacy_list.addItem(self.url_config._normalize_domain(domain))
     
     def remove_legacy_domain(self):
         """Remove selected legacy domain."""
@@ -670,9 +885,10 @@ class URLMigrationWindow(QDialog):
         domains = analyzer.extract_domain_from_config(config_php)
         
         if domains:
-            for domain in domains:
-                self.url_config.add_internal_domain(domain)
-                self.domain_list.addItem(domain)
+            self.domain_list.addItems([
+                self.url_config._normalize_domain(domain) for domain in domains
+                if self.url_config.add_internal_domain(domain)
+            ])
             QMessageBox.information(self, "Success", f"Found {len(domains)} domain(s): {', '.join(domains)}")
         else:
             QMessageBox.information(self, "No Domains", "No domains found in config.php")
@@ -730,9 +946,10 @@ class URLMigrationWindow(QDialog):
         
         # Auto-add extracted domains
         if 'extracted_domains' in results and results['extracted_domains']:
-            for domain in results['extracted_domains']:
-                self.url_config.add_internal_domain(domain)
-                self.domain_list.addItem(domain)
+            self.domain_list.addItems([
+                self.url_config._normalize_domain(domain) for domain in results['extracted_domains']
+                if self.url_config.add_internal_domain(domain)
+            ])
         
         # Populate step 2
         self.populate_step2()
@@ -755,6 +972,7 @@ class URLMigrationWindow(QDialog):
     
     def populate_step2(self):
         """Populate step 2 verification results."""
+        self._ensure_step_built(1)
         if not self.scan_results:
             return
         
@@ -784,25 +1002,27 @@ class URLMigrationWindow(QDialog):
         internal = [u for u in url_instances if u.is_internal][:20]
         external = [u for u in url_instances if not u.is_internal][:10]
         
-        self.sample_table.setRowCount(0)
-        
-        for url in internal:
-            row = self.sample_table.rowCount()
-            self.sample_table.insertRow(row)
-            self.sample_table.setItem(row, 0, QTableWidgetItem("Internal"))
-            self.sample_table.setItem(row, 1, QTableWidgetItem(url.domain))
-            self.sample_table.setItem(row, 2, QTableWidgetItem(url.url[:50]))
-            self.sample_table.setItem(row, 3, QTableWidgetItem(str(url.file_path)))
-        
-        for url in external:
-            row = self.sample_table.rowCount()
-            self.sample_table.insertRow(row)
-            self.sample_table.setItem(row, 0, QTableWidgetItem("External"))
-            item = QTableWidgetItem(url.domain)
-            item.setBackground(QColor(255, 255, 200))
-            self.sample_table.setItem(row, 1, item)
-            self.sample_table.setItem(row, 2, QTableWidgetItem(url.url[:50]))
-            self.sample_table.setItem(row, 3, QTableWidgetItem(str(url.file_path)))
+        rows = [("Internal", u) for u in internal] + [("External", u) for u in external]
+        
+        # Size the table once and fill it with repaints and sorting suspended
+        self.sample_table.setUpdatesEnabled(False)
+        sorting = self.sample_table.isSortingEnabled()
+        self.sample_table.setSortingEnabled(False)
+        self.sample_table.blockSignals(True)
+        try:
+            self.sample_table.setRowCount(len(rows))
+            for row, (kind, url) in enumerate(rows):
+                self.sample_table.setItem(row, 0, QTableWidgetItem(kind))
+                item = QTableWidgetItem(url.domain)
+                if kind == "External":
+                    item.setBackground(QColor(255, 255, 200))
+                self.sample_table.setItem(row, 1, item)
+                self.sample_table.setItem(row, 2, QTableWidgetItem(url.url[:50]))
+                self.sample_table.setItem(row, 3, QTableWidgetItem(str(url.file_path)))
+        finally:
+            self.sample_table.blockSignals(False)
+            self.sample_table.setSortingEnabled(sorting)
+            self.sample_table.setUpdatesEnabled(True)
     
     def prepare_step3(self):
         """Prepare step 3 - generate and display change records."""
@@ -828,32 +1048,7 @@ class URLMigrationWindow(QDialog):
         self.change_records = self.migrator.plan_replacements(internal_urls, helpers)
         
         # Populate changes table
-        self.changes_table.setRowCount(0)
-        
-        for record in self.change_records:
-            row = self.changes_table.rowCount()
-            self.changes_table.insertRow(row)
-            
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox.setChecked(True)
-            self.changes_table.setCellWidget(row, 0, checkbox)
-            
-            # File
-            self.changes_table.setItem(row, 1, QTableWidgetItem(str(record.file_path)))
-            
-            # Line
-            self.changes_table.setItem(row, 2, QTableWidgetItem(str(record.line_number)))
-            
-            # Old URL
-            self.changes_table.setItem(row, 3, QTableWidgetItem(record.old_url[:40]))
-            
-            # New format
-            self.changes_table.setItem(row, 4, QTableWidgetItem(record.new_url[:40]))
-            
-            # Context (first part of line)
-            context = record.old_line[:30] + "..." if len(record.old_line) > 30 else record.old_line
-            self.changes_table.setItem(row, 5, QTableWidgetItem(context))
+        self.changes_model.set_records(self.change_records)
         
         self.changes_summary_label.setText(
             f"Total changes: {len(self.change_records)} in {len(self.migrator.get_changes_by_file())} files"
@@ -864,21 +1059,33 @@ class URLMigrationWindow(QDialog):
         backup_dir = self.config.get("backup_directory", "system-mapper-backups")
         self.backup_dir_label.setText(str(Path(backup_dir).resolve()))
         
-        # Estimate size
-        total_size = sum(f.stat().st_size for f in self.root_dir.rglob('*') if f.is_file())
+        # Estimate size off the GUI thread; the walk can take a while on large trees
+        if self.size_worker and self.size_worker.isRunning():
+            return
+        self.backup_size_label.setText("Calculating...")
+        self.size_worker = BackupSizeWorker(self.root_dir)
+        self.size_worker.finished.connect(self.on_backup_size_ready)
+        self.size_worker.start()
+    
+    @pyqtSlot(object)
+    def on_backup_size_ready(self, total_size):
+        """Show the estimated backup size."""
         size_mb = total_size / (1024 * 1024)
         self.backup_size_label.setText(f"{size_mb:.2f} MB")
     
     def prepare_step5(self):
         """Prepare step 5 - final approval summary."""
+        selected_records = self.get_selected_records()
+        files_by_count = Counter(record.file_path for record in selected_records)
+        
         summary_lines = [
             "MIGRATION SUMMARY",
             "=" * 60,
             f"Root Directory: {self.root_dir}",
             f"Replacement Format: {self.format_combo.currentText()}",
             "",
-            f"Total Changes: {len(self.get_selected_records())}",
-            f"Files to Modify: {len(set(r.file_path for r in self.get_selected_records()))}",
+            f"Total Changes: {len(selected_records)}",
+            f"Files to Modify: {len(files_by_count)}",
             f"Backup Location: {self.backup_path}",
             "",
             "=" * 60,
@@ -886,10 +1093,6 @@ class URLMigrationWindow(QDialog):
             ""
         ]
         
-        files_by_count = {}
-        for record in self.get_selected_records():
-            files_by_count[record.file_path] = files_by_count.get(record.file_path, 0) + 1
-        
         for file_path, count in sorted(files_by_count.items()):
             summary_lines.append(f"  {file_path}: {count} changes")
         
@@ -903,57 +1106,30 @@ class URLMigrationWindow(QDialog):
         # Populate file list for selective rollback
         self.rollback_file_list.clear()
         files = sorted(self.migrator.files_modified)
-        for file_path in files:
-            item = QListWidgetItem(str(file_path))
-            self.rollback_file_list.addItem(item)
+        self.rollback_file_list.addItems([str(file_path) for file_path in files])
     
     def get_selected_records(self):
         """Get list of selected change records from table."""
-        selected = []
-        for row in range(self.changes_table.rowCount()):
-            checkbox = self.changes_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                if row < len(self.change_records):
-                    selected.append(self.change_records[row])
-        return selected
+        return self.changes_model.selected_records()
     
     def filter_changes(self, text):
         """Filter the changes table."""
-        for row in range(self.changes_table.rowCount()):
-            show = True
-            if text:
-                file_item = self.changes_table.item(row, 1)
-                url_item = self.changes_table.item(row, 3)
-                new_item = self.changes_table.item(row, 4)
-                
-                if file_item and url_item and new_item:
-                    file_text = file_item.text().lower()
-                    url_text = url_item.text().lower()
-                    new_text = new_item.text().lower()
-                    filter_text = text.lower()
-                    
-                    show = filter_text in file_text or filter_text in url_text or filter_text in new_text
-            
-            self.changes_table.setRowHidden(row, not show)
+        self.changes_filter.set_filter_text(text)
     
     def select_all_changes(self):
         """Select all visible changes."""
-        for row in range(self.changes_table.rowCount()):
-            if not self.changes_table.isRowHidden(row):
-                checkbox = self.changes_table.cellWidget(row, 0)
-                if checkbox:
-                    checkbox.setChecked(True)
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self.filter_changes(self.filter_input.text())
+        self.changes_model.set_checked_rows(self.changes_filter.source_rows(), True)
     
     def deselect_all_changes(self):
         """Deselect all changes."""
-        for row in range(self.changes_table.rowCount()):
-            checkbox = self.changes_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(False)
+        self.changes_model.set_checked_rows(range(self.changes_model.rowCount()), False)
     
     def on_change_selected(self):
         """Handle change selection in table."""
-        current_row = self.changes_table.currentRow()
+        current_row = self.changes_filter.mapToSource(self.changes_table.currentIndex()).row()
         if current_row >= 0 and current_row < len(self.change_records):
             record = self.change_records[current_row]
             
@@ -1035,20 +1211,31 @@ class URLMigrationWindow(QDialog):
             return
         
         self.apply_button.setEnabled(False)
+        self.prev_button.setEnabled(False)
+        self.next_button.setEnabled(False)
+        self.close_button.setEnabled(False)
         self.apply_progress.setRange(0, 100)
         self.apply_status_label.setText("Applying changes...")
         
-        def progress_callback(current, total):
-            progress = int((current / total) * 100)
-            self.apply_progress.setValue(progress)
-            self.apply_status_label.setText(f"Processing file {current} of {total}...")
+        self.apply_worker = MigrationApplyWorker(self.migrator, selected_records, self.root_dir)
+        self.apply_worker.progress.connect(self.on_apply_progress)
+        self.apply_worker.finished.connect(self.on_apply_finished)
+        self.apply_worker.error.connect(self.on_apply_error)
+        self.apply_worker.start()
+    
+    @pyqtSlot(int, int)
+    def on_apply_progress(self, current, total):
+        """Handle apply progress updates."""
+        self.apply_progress.setValue(int((current / total) * 100))
+        self.apply_status_label.setText(f"Processing file {current} of {total}...")
+    
+    @pyqtSlot(dict)
+    def on_apply_finished(self, outcome):
+        """Show migration results and record the migration."""
+        results = outcome['results']
+        verification = outcome['verification']
         
         try:
-            results = self.migrator.apply_changes(selected_records, progress_callback)
-            
-            # Verify changes
-            verification = self.migrator.verify_changes(self.root_dir)
-            
             result_lines = [
                 "MIGRATION COMPLETE",
                 "=" * 60,
@@ -1091,10 +1278,40 @@ class URLMigrationWindow(QDialog):
                                   f"Report saved to: {report_path}")
             
         except Exception as e:
-            self.apply_results_text.setPlainText(f"ERROR: {str(e)}")
-            QMessageBox.critical(self, "Migration Error", f"Failed to apply changes:\n{str(e)}")
+            self.on_apply_error(str(e))
         finally:
             self.apply_button.setEnabled(True)
+            self.close_button.setEnabled(True)
+            self.update_step_display()
+    
+    @pyqtSlot(str)
+    def on_apply_error(self, error_msg):
+        """Handle migration failure."""
+        self.apply_results_text.setPlainText(f"ERROR: {error_msg}")
+        self.apply_button.setEnabled(True)
+        self.close_button.setEnabled(True)
+        self.update_step_display()
+        QMessageBox.critical(self, "Migration Error", f"Failed to apply changes:\n{error_msg}")
+    
+    def _apply_in_progress(self) -> bool:
+        """Return True while the apply worker is still rewriting files."""
+        if self.apply_worker is None or not self.apply_worker.isRunning():
+            return False
+        QMessageBox.information(self, "Migration In Progress",
+                                "Changes are still being applied. Please wait until the migration finishes.")
+        return True
+    
+    def reject(self):
+        """Keep the dialog open (Esc) while a migration is being applied."""
+        if not self._apply_in_progress():
+            super().reject()
+    
+    def closeEvent(self, event):
+        """Keep the dialog open (window close) while a migration is being applied."""
+        if self._apply_in_progress():
+            event.ignore()
+        else:
+            super().closeEvent(event)
     
     def perform_rollback(self):
         """Perform rollback operation."""
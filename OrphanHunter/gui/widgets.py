@@ -1,11 +1,13 @@
 """Custom PyQt5 widgets for the System Mapper."""
+import html
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QWidget, 
-    QVBoxLayout, QLabel, QProgressBar
+    QTreeWidget, QTreeWidgetItem, QPlainTextEdit, QWidget, 
+    QVBoxLayout, QLabel, QProgressBar, QDialog, QDialogButtonBox, QListView
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QFont
-from typing import Dict, Set
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont, QTextCursor
+from typing import Dict, Iterable, List, Set, Tuple
 
 class FileTreeWidget(QTreeWidget):
     """Custom tree widget for displaying file structure with status."""
@@ -23,6 +25,7 @@ class FileTreeWidget(QTreeWidget):
         self.itemClicked.connect(self._on_item_clicked)
         self.itemChanged.connect(self._on_item_changed)
         self.file_items: Dict[str, QTreeWidgetItem] = {}
+        self._checked: Set[str] = set()  # file keys whose box is checked
     
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle item click."""
@@ -32,20 +35,58 @@ class FileTreeWidget(QTreeWidget):
     
     def _on_item_changed(self, item: QTreeWidgetItem, column: int):
         """Handle checkbox state change."""
-        if column == 0:
-            checked_files = set()
-            for file_key, tree_item in self.file_items.items():
-                if tree_item.checkState(0) == Qt.Checked:
-                    checked_files.add(file_key)
-            self.files_checked.emit(checked_files)
+        if column != 0:
+            return
+        file_key = item.data(0, Qt.UserRole)
+        if not file_key:
+            return
+        if item.checkState(0) == Qt.Checked:
+            self._checked.add(file_key)
+        else:
+            self._checked.discard(file_key)
+        self.files_checked.emit(set(self._checked))
+    
+    @contextmanager
+    def batch_update(self):
+        """Suspend repaints, sorting and per-item signals while many items change."""
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.blockSignals(False)
+            self.setSortingEnabled(sorting)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+            # Item changes were not seen while signals were blocked; resync and report once
+            self._checked = {
+                file_key for file_key, item in self.file_items.items()
+                if item.checkState(0) == Qt.Checked
+            }
+            self.files_checked.emit(self.get_checked_files())
     
     def populate_tree(self, files: Dict):
         """Populate tree with file structure."""
         self.clear()
         self.file_items.clear()
+        self._checked.clear()
+        
+        # Shared per call rather than rebuilt for every item
+        dir_font = QFont()
+        dir_font.setBold(True)
+        dir_color = QColor(100, 100, 255)
+        status_colors = {
+            "Critical": QColor(255, 0, 0),
+            "Navigation": QColor(0, 0, 255),
+            "Orphaned": QColor(128, 128, 128),
+            "Active": QColor(0, 150, 0),
+        }
         
-        # Build directory structure
+        # Build directory structure detached from the view, then attach it in one call
         dir_items: Dict[str, QTreeWidgetItem] = {}
+        top_level_items: List[QTreeWidgetItem] = []
         
         for file_key, file_info in sorted(files.items()):
             path_parts = file_info.relative_path.parts
@@ -62,68 +103,63 @@ class FileTreeWidget(QTreeWidget):
                 
                 if current_path not in dir_items:
                     if current_parent is None:
-                        dir_item = QTreeWidgetItem(self)
+                        dir_item = QTreeWidgetItem([part])
+                        top_level_items.append(dir_item)
                     else:
-                        dir_item = QTreeWidgetItem(current_parent)
+                        dir_item = QTreeWidgetItem(current_parent, [part])
                     
-                    dir_item.setText(0, part)
-                    dir_item.setForeground(0, QColor(100, 100, 255))
-                    font = QFont()
-                    font.setBold(True)
-                    dir_item.setFont(0, font)
+                    dir_item.setForeground(0, dir_color)
+                    dir_item.setFont(0, dir_font)
                     dir_items[current_path] = dir_item
                     current_parent = dir_item
                 else:
                     current_parent = dir_items[current_path]
             
-            # Create file item
-            if current_parent is None:
-                file_item = QTreeWidgetItem(self)
-            else:
-                file_item = QTreeWidgetItem(current_parent)
-            
-            file_item.setText(0, file_info.name)
-            file_item.setData(0, Qt.UserRole, file_key)
-            file_item.setFlags(file_item.flags() | Qt.ItemIsUserCheckable)
-            file_item.setCheckState(0, Qt.Unchecked)
-            
             # Status
             if file_info.is_critical:
                 status = "Critical"
-                file_item.setForeground(1, QColor(255, 0, 0))
             elif file_info.is_navigation:
                 status = "Navigation"
-                file_item.setForeground(1, QColor(0, 0, 255))
             elif file_info.reference_count == 0:
                 status = "Orphaned"
-                file_item.setForeground(1, QColor(128, 128, 128))
             else:
                 status = "Active"
-                file_item.setForeground(1, QColor(0, 150, 0))
             
-            file_item.setText(1, status)
-            file_item.setText(2, str(file_info.reference_count))
-            file_item.setText(3, f"{round(file_info.size/1024, 1)} KB")
+            # Create file item
+            columns = [
+                file_info.name,
+                status,
+                str(file_info.reference_count),
+                f"{round(file_info.size/1024, 1)} KB"
+            ]
+            if current_parent is None:
+                file_item = QTreeWidgetItem(columns)
+                top_level_items.append(file_item)
+            else:
+                file_item = QTreeWidgetItem(current_parent, columns)
+            
+            file_item.setData(0, Qt.UserRole, file_key)
+            file_item.setFlags(file_item.flags() | Qt.ItemIsUserCheckable)
+            file_item.setCheckState(0, Qt.Unchecked)
+            file_item.setForeground(1, status_colors[status])
             
             self.file_items[file_key] = file_item
         
+        self.addTopLevelItems(top_level_items)
         self.expandAll()
     
     def get_checked_files(self) -> Set[str]:
         """Get set of checked file keys."""
-        checked = set()
-        for file_key, item in self.file_items.items():
-            if item.checkState(0) == Qt.Checked:
-                checked.add(file_key)
-        return checked
+        return set(self._checked)
     
     def set_checked_files(self, file_keys: Set[str]):
         """Set which files are checked."""
-        for file_key, item in self.file_items.items():
-            if file_key in file_keys:
-                item.setCheckState(0, Qt.Checked)
-            else:
-                item.setCheckState(0, Qt.Unchecked)
+        with self.batch_update():
+            for file_key, item in self.file_items.items():
+                if file_key in file_keys:
+                    item.setCheckState(0, Qt.Checked)
+                else:
+                    item.setCheckState(0, Qt.Unchecked)
     
     def highlight_orphaned(self):
         """Highlight orphaned files."""
@@ -132,13 +168,25 @@ class FileTreeWidget(QTreeWidget):
                 item.setBackground(0, QColor(255, 255, 200))
 
 
-class LogConsole(QTextEdit):
+class LogConsole(QPlainTextEdit):
     """Console widget for displaying logs."""
     
+    MAX_BLOCKS = 5000
+    
+    COLOR_MAP = {
+        "DEBUG": "#888888",
+        "INFO": "#000000",
+        "WARNING": "#FF8800",
+        "ERROR": "#FF0000",
+        "CRITICAL": "#AA0000"
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
         self.setMaximumHeight(200)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(self.MAX_BLOCKS)
         
         # Set monospace font
         font = QFont("Consolas", 9)
@@ -146,17 +194,20 @@ class LogConsole(QTextEdit):
     
     def append_log(self, message: str, level: str = "INFO"):
         """Append a log message with color coding."""
-        color_map = {
-            "DEBUG": "#888888",
-            "INFO": "#000000",
-            "WARNING": "#FF8800",
-            "ERROR": "#FF0000",
-            "CRITICAL": "#AA0000"
-        }
-        
-        color = color_map.get(level, "#000000")
-        formatted = f'<span style="color: {color};">[{level}] {message}</span>'
-        self.append(formatted)
+        self.append_logs([(message, level)])
+    
+    def append_logs(self, entries: Iterable[Tuple[str, str]]):
+        """Append several log messages in a single edit block."""
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for message, level in entries:
+            color = self.COLOR_MAP.get(level, "#000000")
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(f'<span style="color: {color};">[{level}] {html.escape(message)}</span>')
+        cursor.endEditBlock()
         
         # Auto-scroll to bottom
         self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
@@ -227,3 +278,49 @@ class StatsWidget(QWidget):
         
         self.stats_label.setText("<br>".join(lines))
 
+
+class BackupListModel(QAbstractListModel):
+    """List model over BackupManager.list_backups() entries."""
+    
+    def __init__(self, backups: List[Dict], parent=None):
+        super().__init__(parent)
+        self.backups = backups
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of backups."""
+        return 0 if parent.isValid() else len(self.backups)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Return the display text, tooltip or backup dict for a row."""
+        if not index.isValid():
+            return None
+        backup = self.backups[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{backup['name']}  —  {backup['date_str']}  ({backup['size_mb']} MB)"
+        if role == Qt.ToolTipRole:
+            return str(backup['path'])
+        if role == Qt.UserRole:
+            return backup
+        return None
+
+
+class BackupListDialog(QDialog):
+    """Dialog listing every available backup archive."""
+    
+    def __init__(self, backups: List[Dict], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Backups")
+        self.resize(600, 400)
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(f"{len(backups)} backup(s) available:"))
+        
+        self.model = BackupListModel(backups, self)
+        self.list_view = QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.model)
+        layout.addWidget(self.list_view)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
@@ -28,6 +28,17 @@ class BackupManager:
             print(f"Error calculating checksum for {file_path}: {e}")
             return ""
     
+    def _write_with_checksum(self, zipf: zipfile.ZipFile, file_path: Path, arcname: Path) -> str:
+        """Add a file to the archive and return the SHA256 of the bytes written."""
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipf.compression
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dest:
+            for chunk in iter(lambda: src.read(1024 * 1024), b''):
+                sha256.update(chunk)
+                dest.write(chunk)
+        return sha256.hexdigest()
+    
     def create_backup(self, ignore_patterns: List[str] = None) -> Path:
         """Create a ZIP backup of the entire root directory."""
         ignore_patterns = ignore_patterns or []
@@ -41,30 +52,32 @@ class BackupManager:
             'files': {}
         }
         
+        # Prepare the ignore checks once instead of per file and pattern
+        ignore_names = frozenset(ignore_patterns)
+        backup_dir_str = str(self.backup_dir)
+        
         with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for file_path in self.root_dir.rglob('*'):
                 if file_path.is_file():
-                    # Check if should be ignored
-                    should_ignore = False
-                    for pattern in ignore_patterns:
-                        if pattern in file_path.parts or file_path.name.startswith('.'):
-                            should_ignore = True
-                            break
+                    # Check if should be ignored (dotfiles are skipped whenever patterns are given)
+                    should_ignore = bool(ignore_names) and (
+                        not ignore_names.isdisjoint(file_path.parts) or file_path.name.startswith('.')
+                    )
                     
                     # Don't backup the backup directory itself
-                    if str(self.backup_dir) in str(file_path):
+                    if backup_dir_str in str(file_path):
                         should_ignore = True
                     
                     if not should_ignore:
                         relative_path = file_path.relative_to(self.root_dir)
-                        zipf.write(file_path, relative_path)
                         
-                        # Add to manifest with checksum
-                        checksum = self.calculate_checksum(file_path)
+                        # Add to archive and manifest with checksum from a single read
+                        checksum = self._write_with_checksum(zipf, file_path, relative_path)
+                        stat_result = file_path.stat()
                         manifest['files'][str(relative_path)] = {
                             'checksum': checksum,
-                            'size': file_path.stat().st_size,
-                            'modified': file_path.stat().st_mtime
+                            'size': stat_result.st_size,
+                            'modified': stat_result.st_mtime
                         }
         
         # Save manifest
@@ -1,4 +1,5 @@
 """File and directory deletion management."""
+import os
 import shutil
 from pathlib import Path
 from typing import Set, List, Dict, Optional
@@ -78,6 +79,7 @@ class DeletionManager:
         
         try:
             file_info.path.unlink()
+            self.file_scanner.remove_file(file_key)
             self.deleted_files.append(file_key)
             self.deletion_log.append({
                 'file': file_key,
@@ -96,6 +98,49 @@ class DeletionManager:
             })
             return False
     
+    def delete_files_raw(self, file_keys: List[str]) -> Dict:
+        """Delete many scanned files with plain os.unlink calls.
+        
+        Paths always come from the scanner, so only files inside the scanned tree are removed.
+        """
+        result = {
+            'attempted': len(file_keys),
+            'successful': 0,
+            'failed': 0,
+            'errors': []
+        }
+        
+        for file_key in file_keys:
+            file_info = self.file_scanner.files.get(file_key)
+            if file_info is None:
+                print(f"File not found: {file_key}")
+                path = file_key
+                error = "not tracked by scanner"
+            else:
+                path = str(file_info.path)
+                try:
+                    os.unlink(path)
+                    error = None
+                except OSError as e:
+                    print(f"Error deleting {path}: {e}")
+                    error = str(e)
+            
+            if error is None:
+                self.file_scanner.remove_file(file_key)
+                self.deleted_files.append(file_key)
+                result['successful'] += 1
+            else:
+                result['failed'] += 1
+                result['errors'].append(file_key)
+            self.deletion_log.append({
+                'file': file_key,
+                'path': path,
+                'success': error is None,
+                'error': error
+            })
+        
+        return result
+    
     def delete_directory(self, dir_path: Path, dry_run: bool = False) -> bool:
         """Delete an entire directory."""
         if not dir_path.exists():
@@ -129,6 +174,11 @@ class DeletionManager:
     
     def execute_deletions(self, dry_run: bool = False) -> Dict:
         """Execute all deletions in the queue."""
+        if not dry_run:
+            result = self.delete_files_raw(list(self.deletion_queue))
+            self.deletion_queue.clear()
+            return result
+        
         result = {
             'attempted': len(self.deletion_queue),
             'successful': 0,
@@ -143,9 +193,6 @@ class DeletionManager:
                 result['failed'] += 1
                 result['errors'].append(file_key)
         
-        if not dry_run:
-            self.deletion_queue.clear()
-        
         return result
     
     def cleanup_empty_directories(self, dry_run: bool = False) -> int:
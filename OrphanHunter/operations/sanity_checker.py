@@ -20,7 +20,8 @@ class SanityChecker:
             'safe_to_proceed': True
         }
         
-        # Check for critical files
+        # Check for critical and already-missing files in one pass
+        missing_files = []
         for file_key in files_to_delete:
             file_info = self.file_scanner.get_file_by_relative_path(file_key)
             if not file_info:
@@ -31,8 +32,11 @@ class SanityChecker:
             if file_info.is_critical:
                 issues['critical'].append(f"Critical file marked for deletion: {file_key}")
                 issues['safe_to_proceed'] = False
+            
+            if not file_info.path.exists():
+                missing_files.append(file_key)
         
-        # Check for broken dependencies
+        # Check for broken dependencies; file_dependents is the reverse index built during the scan
         impact = self.dependency_graph.get_deletion_impact(files_to_delete)
         
         if impact['critical_files_affected']:
@@ -54,13 +58,6 @@ class SanityChecker:
                 f"Deletion affects {len(impact['affected_tables'])} database tables"
             )
         
-        # Check if files exist
-        missing_files = []
-        for file_key in files_to_delete:
-            file_info = self.file_scanner.get_file_by_relative_path(file_key)
-            if file_info and not file_info.path.exists():
-                missing_files.append(file_key)
-        
         if missing_files:
             issues['warnings'].append(f"{len(missing_files)} files already deleted or missing")
         
@@ -75,21 +72,20 @@ class SanityChecker:
             'all_ok': True
         }
         
-        # Re-scan to get updated file list
-        remaining_files = [
-            f for f in self.file_scanner.files.values() 
-            if f.path.exists()
-        ]
+        # Stat each tracked file once; references are then checked by set lookup
+        existing = {
+            file_key for file_key, file_info in self.file_scanner.files.items()
+            if file_info.path.exists()
+        }
         
         # Check for broken includes
-        for file_info in remaining_files:
-            if file_info.extension != '.php':
+        for file_key, file_info in self.file_scanner.files.items():
+            if file_info.extension != '.php' or file_key not in existing:
                 continue
             
             # Check if any referenced files are missing
             for ref in file_info.references:
-                ref_file = self.file_scanner.get_file_by_relative_path(ref)
-                if not ref_file or not ref_file.path.exists():
+                if ref not in existing:
                     issues['broken_includes'].append({
                         'file': file_info.relative_path_str,
                         'missing_reference': ref
@@ -98,8 +94,7 @@ class SanityChecker:
         
         # Check navigation files
         for nav_file_key in self.file_scanner.navigation_files:
-            nav_file = self.file_scanner.get_file_by_relative_path(nav_file_key)
-            if not nav_file or not nav_file.path.exists():
+            if nav_file_key not in existing:
                 issues['broken_links'].append(f"Navigation file missing: {nav_file_key}")
                 issues['all_ok'] = False
         
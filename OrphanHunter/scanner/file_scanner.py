@@ -1,21 +1,30 @@
 """File scanner for discovering project structure."""
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from types import MappingProxyType
+from typing import List, Dict, Set, Optional, Tuple
 import fnmatch
+import re
 
 class FileInfo:
     """Information about a scanned file."""
     
-    def __init__(self, path: Path, root_dir: Path):
+    def __init__(self, path: Path, root_dir: Path, stat_result: Optional[os.stat_result] = None):
         self.path = path
         self.root_dir = root_dir
         self.relative_path = path.relative_to(root_dir)
         self.relative_path_str = self.relative_path.as_posix()
         self.name = path.name
         self.extension = path.suffix
-        self.size = path.stat().st_size if path.exists() else 0
-        self.modified_time = path.stat().st_mtime if path.exists() else 0
+        if stat_result is None:
+            try:
+                stat_result = path.stat()
+            except OSError:
+                stat_result = None
+        self.size = stat_result.st_size if stat_result else 0
+        self.modified_time = stat_result.st_mtime if stat_result else 0
+        self.mtime_ns = stat_result.st_mtime_ns if stat_result else 0
         self.is_critical = False
         self.is_navigation = False
         self.reference_count = 0
@@ -34,18 +43,36 @@ class FileScanner:
         self.ignore_patterns = ignore_patterns or []
         self.ignore_dot_dirs = ignore_dot_dirs
         self.blacklist_dirs = [d.strip('/\\') for d in (blacklist_dirs or [])]
+        
+        # Compile patterns once so each entry costs a few set/regex lookups
+        self._ignore_names = frozenset(self.ignore_patterns)
+        self._ignore_re = None
+        if self.ignore_patterns:
+            self._ignore_re = re.compile('|'.join(
+                f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in self.ignore_patterns
+            ))
+        blacklist_normalized = [d.replace('\\', '/') for d in self.blacklist_dirs]
+        self._blacklist_names = frozenset(blacklist_normalized)
+        self._blacklist_re = None
+        if blacklist_normalized:
+            # Exact relative path or anything beneath it
+            self._blacklist_re = re.compile('|'.join(
+                f'(?:{re.escape(d)}(?:/|$))' for d in blacklist_normalized
+            ))
         self.files: Dict[str, FileInfo] = {}
+        self.files_by_ext: Dict[str, List[FileInfo]] = defaultdict(list)  # extension -> files
+        self._ext_histogram: Dict[str, int] = {}  # extension -> file count
+        self._stats_cache = None
         self.directories: Set[Path] = set()
         self.critical_files: Set[str] = set()
         self.navigation_files: Set[str] = set()
         
-    def should_ignore(self, path: Path) -> bool:
+    def should_ignore(self, path: Path, is_dir: Optional[bool] = None) -> bool:
         """Check if path should be ignored based on patterns."""
         # NEVER ignore the root directory itself
         if path.resolve() == self.root_dir:
             return False
         
-        path_str = str(path)
         try:
             relative = path.relative_to(self.root_dir).as_posix()
         except ValueError:
@@ -55,33 +82,40 @@ class FileScanner:
         if relative in ['', '.']:
             return False
         
-        # Check if directory is blacklisted
-        if path.is_dir():
-            dir_name = path.name
-            relative_path = str(path.relative_to(self.root_dir)).replace('\\', '/')
-            
-            # Check blacklist (exact match or subdirectory)
-            for blacklisted in self.blacklist_dirs:
-                blacklisted_normalized = blacklisted.replace('\\', '/')
-                if dir_name == blacklisted_normalized or relative_path == blacklisted_normalized:
-                    return True
-                # Check if it's a subdirectory of a blacklisted directory
-                if relative_path.startswith(blacklisted_normalized + '/'):
-                    return True
+        if is_dir is None:
+            is_dir = path.is_dir()
+        return self._is_ignored(path.name, relative, is_dir, tuple(relative.split('/')))
+    
+    def _is_ignored(self, name: str, relative: str, is_dir: bool,
+                    parts: Optional[Tuple[str, ...]] = None) -> bool:
+        """Match one entry against the precompiled ignore rules.
+        
+        parts defaults to just the entry name, which is enough during a walk
+        because ignored parent directories are never descended into.
+        """
+        if is_dir:
+            # Check blacklist (exact name, exact relative path, or subdirectory)
+            if name in self._blacklist_names:
+                return True
+            if self._blacklist_re and self._blacklist_re.match(relative):
+                return True
             
-            # Check if it's a dot directory (but NOT the root even if it starts with .)
-            if self.ignore_dot_dirs and dir_name.startswith('.') and dir_name not in ['.', '..']:
+            # Check if it's a dot directory
+            if self.ignore_dot_dirs and name.startswith('.') and name not in ('.', '..'):
                 return True
         
-        # Check ignore patterns
-        for pattern in self.ignore_patterns:
-            # Check if it's a directory name match
-            if pattern in path.parts:
+        # Directory name match on any path component
+        if parts is None:
+            if name in self._ignore_names:
                 return True
-            # Check if it matches the pattern
-            if fnmatch.fnmatch(path.name, pattern):
+        elif not self._ignore_names.isdisjoint(parts):
+            return True
+        
+        # Glob match on the name or the relative path
+        if self._ignore_re:
+            if self._ignore_re.match(os.path.normcase(name)):
                 return True
-            if fnmatch.fnmatch(relative, pattern):
+            if self._ignore_re.match(os.path.normcase(relative)):
                 return True
         return False
     
@@ -93,35 +127,65 @@ class FileScanner:
             raise ValueError(f"Root directory does not exist: {self.root_dir}")
         
         self.files.clear()
+        self.files_by_ext.clear()
+        self._ext_histogram.clear()
+        self._stats_cache = None
         self.directories.clear()
         
-        for root, dirs, files in os.walk(self.root_dir):
-            root_path = Path(root)
-            
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if not self.should_ignore(root_path / d)]
-            
+        # Single os.scandir pass: DirEntry usually gets the entry type from the
+        # directory listing, so mostly only the files that are kept are stat()ed.
+        pending = [(self.root_dir, '')]
+        while pending:
+            root_path, root_relative = pending.pop()
             self.directories.add(root_path)
             
-            for file in files:
-                file_path = root_path / file
+            try:
+                with os.scandir(root_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                entry_path = root_path / entry.name
+                entry_relative = f"{root_relative}/{entry.name}" if root_relative else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
                 
-                if self.should_ignore(file_path):
+                if is_dir:
+                    # Like os.walk, do not descend into symlinked directories
+                    if not entry.is_symlink() and not self._is_ignored(entry.name, entry_relative, True):
+                        subdirs.append((entry_path, entry_relative))
+                    continue
+                
+                if self._is_ignored(entry.name, entry_relative, False):
                     continue
                 
                 # Check if file has one of the target extensions
-                if extensions and file_path.suffix not in extensions:
+                if extensions and entry_path.suffix not in extensions:
                     continue
                 
-                file_info = FileInfo(file_path, self.root_dir)
+                try:
+                    stat_result = entry.stat()
+                except OSError:
+                    stat_result = None
+                
+                file_info = FileInfo(entry_path, self.root_dir, stat_result)
                 file_key = file_info.relative_path_str
                 self.files[file_key] = file_info
+                self.files_by_ext[file_info.extension].append(file_info)
+                self._ext_histogram[file_info.extension] = self._ext_histogram.get(file_info.extension, 0) + 1
+            
+            pending.extend(reversed(subdirs))
         
         return self.files
     
     def mark_critical_files(self, critical_file_names: List[str]):
         """Mark files as critical based on filenames."""
         self.critical_files.clear()
+        self._stats_cache = None
         for file_key, file_info in self.files.items():
             if file_info.name in critical_file_names:
                 file_info.is_critical = True
@@ -130,11 +194,42 @@ class FileScanner:
     def mark_navigation_files(self, navigation_file_names: List[str]):
         """Mark files as navigation files."""
         self.navigation_files.clear()
+        self._stats_cache = None
         for file_key, file_info in self.files.items():
             if file_info.name in navigation_file_names:
                 file_info.is_navigation = True
                 self.navigation_files.add(file_key)
     
+    def remove_file(self, file_key: str) -> Optional[FileInfo]:
+        """Drop a file from the scan results, keeping indexes and counters in step."""
+        file_info = self.files.pop(file_key, None)
+        if file_info is None:
+            return None
+        
+        bucket = self.files_by_ext.get(file_info.extension)
+        if bucket is not None:
+            bucket.remove(file_info)
+        count = self._ext_histogram.get(file_info.extension, 0) - 1
+        if count > 0:
+            self._ext_histogram[file_info.extension] = count
+        else:
+            self._ext_histogram.pop(file_info.extension, None)
+        # critical_files/navigation_files keep the key so post-deletion checks still report it missing
+        self._stats_cache = None
+        return file_info
+    
+    @property
+    def stats(self):
+        """Read-only file counts, rebuilt only after the file set changes."""
+        if self._stats_cache is None:
+            self._stats_cache = MappingProxyType({
+                'total_files': len(self.files),
+                'ext_counts': MappingProxyType(dict(self._ext_histogram)),
+                'critical_files': len(self.critical_files),
+                'navigation_files': len(self.navigation_files)
+            })
+        return self._stats_cache
+    
     def find_file_by_name(self, filename: str) -> List[FileInfo]:
         """Find all files matching the given filename."""
         results = []
@@ -149,7 +244,7 @@ class FileScanner:
     
     def get_all_php_files(self) -> List[FileInfo]:
         """Get all PHP files."""
-        return [f for f in self.files.values() if f.extension == '.php']
+        return list(self.files_by_ext.get('.php', ()))
     
     def get_directory_tree(self) -> Dict:
         """Get directory tree structure."""
@@ -1,19 +1,62 @@
 """Live website scanner and crawler for SEO and content analysis."""
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from typing import Dict, Set, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 from bs4 import BeautifulSoup
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 from collections import deque
+from functools import lru_cache
+
+_SCHEME_PREFIXES = ('http://', 'https://')
+
+# Non-HTML resources the crawler never fetches; a tuple so one endswith() call checks them all
+_SKIP_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp',
+    '.pdf', '.zip', '.tar', '.gz', '.rar',
+    '.mp3', '.mp4', '.avi', '.mov',
+    '.css', '.js', '.xml', '.json',
+    '.woff', '.woff2', '.ttf', '.eot'
+)
+
+# Normalized links are parsed again for their scheme, host and path; share one parse per URL
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """Normalize a URL; cached because navigation links repeat on every page."""
+    if not url.startswith(_SCHEME_PREFIXES):
+        url = f'https://{url}'
+    
+    parsed = urlparse(url)
+    # Remove fragment and ensure consistent format
+    return urlunparse((
+        parsed.scheme,
+        parsed.netloc,
+        parsed.path.rstrip('/') if parsed.path != '/' else '/',
+        parsed.params,
+        parsed.query,
+        ''  # Remove fragment
+    ))
 
 
 class PageInfo:
     """Information about a crawled page."""
     
+    # No per-instance __dict__; large crawls hold thousands of these
+    __slots__ = (
+        'url', 'status_code', 'title', 'description', 'keywords', 'h1_tags', 'h2_tags',
+        'links', 'images', 'scripts', 'stylesheets', 'content_length', 'load_time',
+        'last_modified', 'canonical_url', 'meta_robots', 'response_headers',
+        'crawl_time', 'error'
+    )
+    
     def __init__(self, url: str):
         self.url = url
         self.status_code: Optional[int] = None
@@ -62,44 +105,62 @@ class PageInfo:
 class SiteScanner:
     """Crawl and analyze websites similar to SEMRush."""
     
-    def __init__(self, base_url: str, max_pages: int = 100):
+    DEFAULT_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+    }
+    
+    def __init__(self, base_url: str, max_pages: int = 100, session: Optional[requests.Session] = None):
         self.base_url = self._normalize_url(base_url)
         self.domain = urlparse(self.base_url).netloc
         self.max_pages = max_pages
         self.visited_urls: Set[str] = set()
         self.to_visit: deque = deque([self.base_url])
+        self._queued: Set[str] = {self.base_url}  # every URL ever put on to_visit
+        self._lock = threading.Lock()  # guards visited_urls, to_visit and pages across workers
         self.pages: Dict[str, PageInfo] = {}
+        # Running totals over pages, kept by _record_page so statistics need no full pass
+        self._successful = 0
+        self._errors = 0
+        self._successful_load_time = 0.0
         self.crawling = False
+        self._cancel = threading.Event()  # set by stop_crawl; also wakes workers from the polite delay
         self.crawl_thread = None
         self.crawl_callback = None
+        self.stats_dirty = True  # Set whenever get_statistics() would return something new
+        self.stats_callback = None  # Receives get_statistics() snapshots during a crawl
+        self.stats_every_pages = 10  # Report stats after this many pages...
+        self.stats_interval = 0.5    # ...or this many seconds, whichever comes first
         self.user_agent = 'OrphanHunter/1.2 (SEO Scanner; +https://github.com/Hazardous-God/orphanhunter)'
         self.delay_between_requests = 1.0  # Polite crawling delay in seconds
         self.timeout = 10  # Request timeout in seconds
         self.follow_external = False  # Whether to follow external links
-        
+        self.max_workers = 1  # Concurrent fetches; each worker keeps the polite delay
+        # Keep-alive connections are reused across pages (and across crawls when a session is passed in)
+        self.session = session or self.create_session()
+        self.session.headers['User-Agent'] = self.user_agent
+        
+    @classmethod
+    def create_session(cls, pool_size: int = 10) -> requests.Session:
+        """Create a pooled HTTP session with the crawler's default headers."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(cls.DEFAULT_HEADERS)
+        return session
+    
     def _normalize_url(self, url: str) -> str:
         """Normalize URL to ensure consistency."""
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        parsed = urlparse(url)
-        # Remove fragment and ensure consistent format
-        normalized = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path.rstrip('/') if parsed.path != '/' else '/',
-            parsed.params,
-            parsed.query,
-            ''  # Remove fragment
-        ))
-        return normalized
+        return _normalize_url(url)
     
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid and should be crawled."""
         if not url:
             return False
         
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         
         # Check if it's a valid HTTP(S) URL
         if parsed.scheme not in ('http', 'https'):
@@ -110,16 +171,7 @@ class SiteScanner:
             return False
         
         # Skip common non-HTML resources
-        skip_extensions = {
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp',
-            '.pdf', '.zip', '.tar', '.gz', '.rar',
-            '.mp3', '.mp4', '.avi', '.mov',
-            '.css', '.js', '.xml', '.json',
-            '.woff', '.woff2', '.ttf', '.eot'
-        }
-        
-        path_lower = parsed.path.lower()
-        if any(path_lower.endswith(ext) for ext in skip_extensions):
+        if parsed.path.lower().endswith(_SKIP_EXTENSIONS):
             return False
         
         return True
@@ -210,46 +262,58 @@ class SiteScanner:
     
     def crawl_page(self, url: str) -> Optional[PageInfo]:
         """Crawl a single page."""
-        if url in self.visited_urls:
-            return None
-        
-        self.visited_urls.add(url)
+        with self._lock:
+            if url in self.visited_urls:
+                return None
+            self.visited_urls.add(url)
         
+        return self._fetch_page(url)
+    
+    def _fetch_page(self, url: str) -> PageInfo:
+        """Fetch and parse a page already marked as visited."""
         try:
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
             start_time = time.time()
-            response = requests.get(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
             end_time = time.time()
             
             page = self._extract_page_info(url, response)
             page.load_time = end_time - start_time
-            
-            self.pages[url] = page
-            
-            # Add new links to crawl queue
-            if page.links:
-                for link in page.links:
-                    if link not in self.visited_urls and link not in self.to_visit:
-                        self.to_visit.append(link)
-            
-            return page
         
         except requests.RequestException as e:
             page = PageInfo(url)
             page.error = f"Request error: {str(e)}"
-            self.pages[url] = page
-            return page
         
         except Exception as e:
             page = PageInfo(url)
             page.error = f"Unexpected error: {str(e)}"
-            self.pages[url] = page
-            return page
+        
+        with self._lock:
+            self._record_page(url, page)
+            
+            # Add new links to crawl queue
+            for link in page.links:
+                if link not in self._queued:
+                    self._queued.add(link)
+                    self.to_visit.append(link)
+        
+        return page
+    
+    def _record_page(self, url: str, page: PageInfo):
+        """Store a crawled page, update the running totals and flag the statistics as changed."""
+        previous = self.pages.get(url)
+        if previous is not None:
+            self._count_page(previous, -1)
+        self.pages[url] = page
+        self._count_page(page, 1)
+        self.stats_dirty = True
+    
+    def _count_page(self, page: PageInfo, sign: int):
+        """Add (sign=1) or remove (sign=-1) a page's share of the running totals."""
+        if page.status_code == 200:
+            self._successful += sign
+            self._successful_load_time += sign * page.load_time
+        if page.error is not None:
+            self._errors += sign
     
     def start_crawl(self, callback=None):
         """Start crawling in a background thread."""
@@ -257,51 +321,108 @@ class SiteScanner:
             return
         
         self.crawling = True
+        self._cancel.clear()
+        self.stats_dirty = True
         self.crawl_callback = callback
         self.crawl_thread = threading.Thread(target=self._crawl_loop, daemon=True)
         self.crawl_thread.start()
     
     def stop_crawl(self):
-        """Stop the crawling process."""
-        self.crawling = False
-        if self.crawl_thread:
-            self.crawl_thread.join(timeout=10)
-            self.crawl_thread = None
+        """Ask the crawl to stop without waiting for it.
+        
+        Pages already being fetched are still reported, then the crawl thread
+        sends 'crawl_complete' and clears crawling as usual.
+        """
+        self._cancel.set()
+    
+    @property
+    def stopping(self) -> bool:
+        """True while a stop has been requested but the crawl is still winding down."""
+        return self.crawling and self._cancel.is_set()
+    
+    def _claim_next_url(self) -> Optional[str]:
+        """Pop the next unvisited URL and mark it visited, or None if none is ready."""
+        with self._lock:
+            while self.to_visit and len(self.visited_urls) < self.max_pages:
+                url = self.to_visit.popleft()
+                if url not in self.visited_urls:
+                    self.visited_urls.add(url)
+                    return url
+        return None
+    
+    def _crawl_worker(self, url: str) -> PageInfo:
+        """Fetch one page on a pool thread, then wait out the polite delay."""
+        page = self._fetch_page(url)
+        if not self._cancel.is_set():
+            self._cancel.wait(self.delay_between_requests)
+        return page
     
     def _crawl_loop(self):
-        """Main crawling loop."""
-        while self.crawling and self.to_visit and len(self.visited_urls) < self.max_pages:
-            url = self.to_visit.popleft()
-            
-            if url in self.visited_urls:
-                continue
-            
-            page = self.crawl_page(url)
-            
-            if self.crawl_callback:
-                self.crawl_callback('page_crawled', page)
+        """Main crawling loop.
+        
+        Keeps up to max_workers fetches in flight; each finished page feeds
+        its links back into to_visit for the next free worker.
+        """
+        max_workers = max(1, self.max_workers)
+        in_flight = set()
+        pages_since_report = 0
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawl') as executor:
+            while not self._cancel.is_set():
+                while len(in_flight) < max_workers:
+                    url = self._claim_next_url()
+                    if url is None:
+                        break
+                    in_flight.add(executor.submit(self._crawl_worker, url))
+                
+                if not in_flight:
+                    break
+                
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if self.crawl_callback:
+                        self.crawl_callback('page_crawled', future.result())
+                
+                # Coalesce stats reports by page count or elapsed time
+                pages_since_report += len(done)
+                now = time.monotonic()
+                if pages_since_report >= self.stats_every_pages or now - last_report >= self.stats_interval:
+                    self._report_stats()
+                    pages_since_report = 0
+                    last_report = now
             
-            # Polite delay between requests
-            if self.crawling and self.to_visit:
-                time.sleep(self.delay_between_requests)
+            # Report pages still finishing after a stop request
+            for future in in_flight:
+                page = future.result()
+                if self.crawl_callback:
+                    self.crawl_callback('page_crawled', page)
         
         self.crawling = False
+        self.stats_dirty = True
+        self._report_stats()
         if self.crawl_callback:
             self.crawl_callback('crawl_complete', {
                 'total_pages': len(self.pages),
-                'successful': sum(1 for p in self.pages.values() if p.status_code == 200),
-                'errors': sum(1 for p in self.pages.values() if p.error is not None)
+                'successful': self._successful,
+                'errors': self._errors
             })
     
+    def _report_stats(self):
+        """Send a statistics snapshot to stats_callback if anything changed."""
+        if self.stats_callback and self.stats_dirty:
+            self.stats_callback(self.get_statistics())
+    
     def get_statistics(self) -> Dict:
-        """Get crawl statistics."""
+        """Get crawl statistics and clear the dirty flag."""
+        # Clear before reading so a page stored mid-read marks the next call dirty
+        self.stats_dirty = False
         total_pages = len(self.pages)
-        successful = sum(1 for p in self.pages.values() if p.status_code == 200)
-        errors = sum(1 for p in self.pages.values() if p.error is not None)
+        successful = self._successful
+        errors = self._errors
         
         avg_load_time = 0
         if successful > 0:
-            avg_load_time = sum(p.load_time for p in self.pages.values() if p.status_code == 200) / successful
+            avg_load_time = self._successful_load_time / successful
         
         return {
             'total_pages': total_pages,
@@ -387,17 +508,9 @@ class SiteScannerDB:
         except Exception as e:
             return False, f"Error creating table: {str(e)}"
     
-    def save_page(self, page: PageInfo) -> Tuple[bool, str]:
-        """Save or update a page in the database."""
-        if not self.db.connected:
-            return False, "Database not connected"
-        
-        try:
-            domain = urlparse(page.url).netloc
-            page_data = page.to_dict()
-            
-            # Use INSERT ... ON DUPLICATE KEY UPDATE to handle both insert and update
-            insert_sql = f"""
+    def _upsert_sql(self) -> str:
+        """INSERT ... ON DUPLICATE KEY UPDATE statement for one page row."""
+        return f"""
             INSERT INTO `{self.table_name}` (
                 url, domain, status_code, title, description, keywords,
                 h1_tags, h2_tags, links, images, scripts, stylesheets,
@@ -425,29 +538,41 @@ class SiteScannerDB:
                 error = VALUES(error),
                 updated_at = CURRENT_TIMESTAMP
             """
-            
-            self.db.cursor.execute(insert_sql, (
-                page.url,
-                domain,
-                page.status_code,
-                page.title,
-                page.description,
-                page.keywords,
-                page_data['h1_tags'],
-                page_data['h2_tags'],
-                page_data['links'],
-                page_data['images'],
-                page_data['scripts'],
-                page_data['stylesheets'],
-                page.content_length,
-                page.load_time,
-                page.last_modified,
-                page.canonical_url,
-                page.meta_robots,
-                page.crawl_time,
-                page.error
-            ))
-            
+    
+    def _page_params(self, page: PageInfo) -> Tuple:
+        """Parameter tuple matching _upsert_sql for a page."""
+        domain = _parse_url(page.url).netloc
+        page_data = page.to_dict()
+        return (
+            page.url,
+            domain,
+            page.status_code,
+            page.title,
+            page.description,
+            page.keywords,
+            page_data['h1_tags'],
+            page_data['h2_tags'],
+            page_data['links'],
+            page_data['images'],
+            page_data['scripts'],
+            page_data['stylesheets'],
+            page.content_length,
+            page.load_time,
+            page.last_modified,
+            page.canonical_url,
+            page.meta_robots,
+            page.crawl_time,
+            page.error
+        )
+    
+    def save_page(self, page: PageInfo) -> Tuple[bool, str]:
+        """Save or update a page in the database."""
+        if not self.db.connected:
+            return False, "Database not connected"
+        
+        try:
+            # Use INSERT ... ON DUPLICATE KEY UPDATE to handle both insert and update
+            self.db.cursor.execute(self._upsert_sql(), self._page_params(page))
             self.db.connection.commit()
             return True, f"Saved page: {page.url}"
         
@@ -455,6 +580,36 @@ class SiteScannerDB:
             self.db.connection.rollback()
             return False, f"Error saving page: {str(e)}"
     
+    def save_pages_bulk(self, pages: List[PageInfo], batch_size: int = 500) -> Tuple[bool, str, int]:
+        """Save pages with one executemany and one commit per batch.
+        
+        A batch that fails is rolled back and retried row by row, so a single
+        bad page doesn't drop the rest of its batch.
+        """
+        if not self.db.connected:
+            return False, "Database not connected", 0
+        
+        sql = self._upsert_sql()
+        saved_count = 0
+        errors = []
+        for start in range(0, len(pages), batch_size):
+            batch = pages[start:start + batch_size]
+            try:
+                self.db.cursor.executemany(sql, [self._page_params(page) for page in batch])
+                self.db.connection.commit()
+                saved_count += len(batch)
+            except Exception as e:
+                self.db.connection.rollback()
+                errors.append(str(e))
+                for page in batch:
+                    success, msg = self.save_page(page)
+                    if success:
+                        saved_count += 1
+        
+        if errors:
+            return saved_count > 0, f"Saved {saved_count} of {len(pages)} pages ({len(errors)} batch error(s))", saved_count
+        return True, f"Saved {saved_count} pages", saved_count
+    
     def get_pages_by_domain(self, domain: str) -> List[Dict]:
         """Retrieve all pages for a domain."""
         if not self.db.connected:
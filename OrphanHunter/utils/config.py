@@ -19,6 +19,7 @@ class Config:
             "sql_dump_path": "",
             "config_php_path": "",  # Path to config.php for live database connection
             "use_live_database": False,  # Use live DB connection instead of SQL dump
+            "force_full_rescan": False,  # Ignore cached dependency graph and URL scan results and re-read everything
             "backup_directory": "system-mapper-backups",
             "ignore_patterns": [".git", "node_modules", "__pycache__", "*.pyc", ".vscode", ".idea"],
             "ignore_dot_directories": True,  # Ignore all directories starting with .
@@ -35,8 +36,10 @@ class Config:
             "scan_extensions": [".php", ".html", ".htm", ".js", ".ts", ".json", ".css"],
             "sql_extensions": [".sql"],
             "enable_verbose_references": True,  # Show detailed references with line numbers and snippets
+            "enable_orphan_analysis": True,  # Build the dependency graph and list orphaned files
             "enable_asset_analysis": True,  # Analyze orphaned JS, TS, JSON, CSS files
             "enable_css_analysis": True,  # Analyze CSS conflicts and overlaps
+            "debug": False,  # Include full tracebacks in worker error messages
             "last_scan_date": None,
             "last_backup_path": None,
             "url_migration": {
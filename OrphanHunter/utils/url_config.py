@@ -3,6 +3,18 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _normalize_domain_cached(domain: str) -> str:
+    """Normalize domain by removing protocol and trailing slashes."""
+    domain = domain.strip()
+    # Remove protocol
+    domain = domain.replace('https://', '').replace('http://', '')
+    # Remove trailing slash
+    domain = domain.rstrip('/')
+    return domain
 
 
 class URLConfig:
@@ -54,17 +66,21 @@ class URLConfig:
         """Set configuration value."""
         self.config[key] = value
     
-    def add_internal_domain(self, domain: str):
-        """Add a domain to internal domains list."""
+    def add_internal_domain(self, domain: str) -> bool:
+        """Add a domain to internal domains list; returns True if it was new."""
         domain = self._normalize_domain(domain)
         if domain and domain not in self.config["internal_domains"]:
             self.config["internal_domains"].append(domain)
+            return True
+        return False
     
-    def add_legacy_domain(self, domain: str):
-        """Add a domain to legacy domains list."""
+    def add_legacy_domain(self, domain: str) -> bool:
+        """Add a domain to legacy domains list; returns True if it was new."""
         domain = self._normalize_domain(domain)
         if domain and domain not in self.config["legacy_domains"]:
             self.config["legacy_domains"].append(domain)
+            return True
+        return False
     
     def remove_internal_domain(self, domain: str):
         """Remove a domain from internal domains list."""
@@ -149,12 +165,7 @@ class URLConfig:
     
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain by removing protocol and trailing slashes."""
-        domain = domain.strip()
-        # Remove protocol
-        domain = domain.replace('https://', '').replace('http://', '')
-        # Remove trailing slash
-        domain = domain.rstrip('/')
-        return domain
+        return _normalize_domain_cached(domain)
     
     def reset_to_defaults(self):
         """Reset configuration to defaults."""
@@ -12,6 +12,7 @@ PORTABLE MODE: This tool is fully self-contained and portable.
 import sys
 import os
 import subprocess
+import multiprocessing
 from pathlib import Path
 
 # --- BOOTSTRAP SECTION ---
@@ -207,8 +208,9 @@ def bootstrap():
 
 # --- END BOOTSTRAP SECTION ---
 
-# Run bootstrap before importing application modules
-if bootstrap():
+# Run bootstrap before importing application modules.
+# Skipped in multiprocessing children, which re-import this module as __mp_main__.
+if __name__ == '__main__' and bootstrap():
     # Now safe to import application modules
     try:
         from PyQt5.QtWidgets import QApplication
@@ -236,6 +238,7 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
@@ -0,0 +1,48 @@
+"""Regression checks for batch file deletion."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from OrphanHunter.scanner.file_scanner import FileScanner
+from OrphanHunter.operations.deletion_manager import DeletionManager
+
+
+class DeleteFilesRawTest(unittest.TestCase):
+    """delete_files_raw must only remove files from the scanned tree."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.scanned = base / "scanned"
+        self.other = base / "other"
+        for root in (self.scanned, self.other):
+            (root / "sub").mkdir(parents=True)
+            (root / "orphan.php").write_text("<?php ?>\n")
+            (root / "sub" / "old.php").write_text("<?php ?>\n")
+            (root / "index.php").write_text("<?php ?>\n")
+
+        self.scanner = FileScanner(str(self.scanned))
+        self.scanner.scan()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_only_scanned_files_are_removed(self):
+        # The GUI passes the root path field, which may no longer match the scanned tree
+        manager = DeletionManager(self.scanner, self.other)
+
+        result = manager.delete_files_raw(["orphan.php", "sub/old.php", "missing.php"])
+
+        self.assertEqual(result['successful'], 2)
+        self.assertEqual(result['errors'], ["missing.php"])
+        self.assertFalse((self.scanned / "orphan.php").exists())
+        self.assertFalse((self.scanned / "sub" / "old.php").exists())
+        self.assertTrue((self.scanned / "index.php").exists())
+        for name in ("orphan.php", "sub/old.php", "index.php"):
+            self.assertTrue((self.other / name).exists(), name)
+        self.assertNotIn("orphan.php", self.scanner.files)
+        self.assertIn("index.php", self.scanner.files)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Regression checks for the on-disk dependency parse cache."""
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from OrphanHunter.scanner.file_scanner import FileScanner
+from OrphanHunter.analyzer.dependency_graph import DependencyGraph
+from OrphanHunter.analyzer import graph_cache
+from OrphanHunter.analyzer.graph_cache import GraphCache
+
+
+class GraphCacheTest(unittest.TestCase):
+    """Parse results are only reused for files whose stat signature is unchanged."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.root = base / "site"
+        self.root.mkdir()
+        (self.root / "index.php").write_text("<?php include 'header.php'; ?>\n")
+        (self.root / "header.php").write_text("<?php echo 'nav'; ?>\n")
+        (self.root / "old.php").write_text("<?php echo 'old'; ?>\n")
+        self.cache = GraphCache(self.root, base / "cache")
+        self.sql_tables = {"users"}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _build(self, cached_results=None):
+        scanner = FileScanner(str(self.root))
+        scanner.scan()
+        graph = DependencyGraph(scanner, scanner.root_dir)
+        graph.build_graph(self.sql_tables, cached_results=cached_results)
+        return scanner, graph
+
+    def _build_and_save(self):
+        scanner, graph = self._build()
+        self.cache.save(scanner, self.sql_tables, graph.parse_results)
+        return graph
+
+    def test_round_trip_reuses_every_file(self):
+        graph = self._build_and_save()
+        scanner = FileScanner(str(self.root))
+        scanner.scan()
+
+        cached = self.cache.load(scanner, self.sql_tables)
+
+        self.assertEqual(set(cached), set(scanner.files))
+        self.assertEqual(self.cache.stale_entries, 0)
+        _, rebuilt = self._build(cached)
+        self.assertEqual(rebuilt.file_dependencies, graph.file_dependencies)
+        self.assertEqual(rebuilt.file_dependents, graph.file_dependents)
+
+    def test_modified_and_removed_files_are_invalidated(self):
+        self._build_and_save()
+        header = self.root / "header.php"
+        header.write_text("<?php echo 'new nav'; ?>\n")
+        os.utime(header, ns=(1, 1))
+        (self.root / "old.php").unlink()
+        scanner = FileScanner(str(self.root))
+        scanner.scan()
+
+        cached = self.cache.load(scanner, self.sql_tables)
+
+        self.assertEqual(set(cached), {"index.php"})
+        self.assertEqual(self.cache.stale_entries, 2)
+
+    def test_sql_table_change_discards_cache(self):
+        self._build_and_save()
+        scanner = FileScanner(str(self.root))
+        scanner.scan()
+
+        self.assertEqual(self.cache.load(scanner, {"users", "posts"}), {})
+
+    def test_version_mismatch_discards_cache(self):
+        self._build_and_save()
+        with open(self.cache.cache_path, 'rb') as f:
+            data = pickle.load(f)
+        data['version'] = graph_cache.CACHE_VERSION + 1
+        with open(self.cache.cache_path, 'wb') as f:
+            pickle.dump(data, f)
+        scanner = FileScanner(str(self.root))
+        scanner.scan()
+
+        self.assertEqual(self.cache.load(scanner, self.sql_tables), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Regression checks for post-deletion sanity checking."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from OrphanHunter.scanner.file_scanner import FileScanner
+from OrphanHunter.analyzer.dependency_graph import DependencyGraph
+from OrphanHunter.operations.deletion_manager import DeletionManager
+from OrphanHunter.operations.sanity_checker import SanityChecker
+
+
+class PostDeletionCheckTest(unittest.TestCase):
+    """Deleting tracked files must still be reported by post_deletion_check."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "index.php").write_text("<?php include 'header.php'; ?>\n")
+        (self.root / "header.php").write_text("<?php echo 'nav'; ?>\n")
+
+        self.scanner = FileScanner(str(self.root))
+        self.scanner.scan()
+        self.scanner.mark_navigation_files(["header.php"])
+        self.checker = SanityChecker(self.scanner, DependencyGraph(self.scanner, self.scanner.root_dir))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_deleted_navigation_file_is_reported(self):
+        self.assertTrue(DeletionManager(self.scanner, self.root).delete_file("header.php"))
+
+        issues = self.checker.post_deletion_check()
+
+        self.assertFalse(issues['all_ok'])
+        self.assertIn("Navigation file missing: header.php", issues['broken_links'])
+
+
+if __name__ == '__main__':
+    unittest.main()
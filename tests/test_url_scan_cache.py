@@ -0,0 +1,116 @@
+"""Regression checks for the on-disk URL scan cache."""
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from OrphanHunter.analyzer.url_analyzer import URLAnalyzer
+from OrphanHunter.analyzer import url_scan_cache
+from OrphanHunter.analyzer.url_scan_cache import URLScanCache
+
+
+class URLScanCacheTest(unittest.TestCase):
+    """Cached results are only reused when settings, version and stat signature match."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        base = Path(self._tmp.name)
+        self.root = base / "site"
+        self.root.mkdir()
+        (self.root / "index.php").write_text(
+            '<a href="https://example.com/about">About</a>\n'
+            '<a href="https://other.org/page">Other</a>\n'
+        )
+        (self.root / "page.html").write_text('<img src="https://example.com/logo.png">\n')
+        self.cache = URLScanCache(self.root, base / "cache")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _scan(self, analyzer, cached_results=None):
+        return analyzer.scan_directory(self.root, ['.php', '.html'], cached_results=cached_results)
+
+    def _scan_and_save(self, analyzer):
+        self._scan(analyzer)
+        self.cache.save(analyzer.cache_settings(), analyzer.file_results)
+
+    def test_settings_mismatch_discards_cache(self):
+        self._scan_and_save(URLAnalyzer(['example.com']))
+
+        self.assertTrue(self.cache.load(URLAnalyzer(['example.com']).cache_settings()))
+        whitelisted = URLAnalyzer(['example.com'], ['other.org'])
+        self.assertEqual(self.cache.load(whitelisted.cache_settings()), {})
+
+    def test_version_mismatch_discards_cache(self):
+        analyzer = URLAnalyzer(['example.com'])
+        self._scan_and_save(analyzer)
+
+        with open(self.cache.cache_path, 'rb') as f:
+            data = pickle.load(f)
+        data['version'] = url_scan_cache.CACHE_VERSION - 1
+        with open(self.cache.cache_path, 'wb') as f:
+            pickle.dump(data, f)
+
+        self.assertEqual(self.cache.load(analyzer.cache_settings()), {})
+
+    def test_unchanged_files_reuse_cached_results(self):
+        self._scan_and_save(URLAnalyzer(['example.com']))
+        index_key = str(self.root / "index.php")
+
+        analyzer = URLAnalyzer(['example.com'])
+        cached = self.cache.load(analyzer.cache_settings())
+        self._scan(analyzer, cached)
+        self.assertFalse(analyzer.results_changed)
+        self.assertIs(analyzer.file_results[index_key], cached[index_key])
+
+        page = self.root / "page.html"
+        page.write_text('<img src="https://example.com/new-logo.png">\n')
+        os.utime(page, ns=(1, 1))
+        analyzer = URLAnalyzer(['example.com'])
+        urls = sorted(instance.url for instance in self._scan(analyzer, cached))
+
+        self.assertTrue(analyzer.results_changed)
+        self.assertIs(analyzer.file_results[index_key], cached[index_key])
+        self.assertEqual(urls, ["https://example.com/about",
+                                "https://example.com/new-logo.png",
+                                "https://other.org/page"])
+
+    def test_removed_file_marks_results_changed(self):
+        self._scan_and_save(URLAnalyzer(['example.com']))
+        (self.root / "page.html").unlink()
+
+        analyzer = URLAnalyzer(['example.com'])
+        self._scan(analyzer, self.cache.load(analyzer.cache_settings()))
+
+        self.assertTrue(analyzer.results_changed)
+        self.assertNotIn(str(self.root / "page.html"), analyzer.file_results)
+
+    def test_cached_results_are_reclassified_after_domain_edit(self):
+        self._scan_and_save(URLAnalyzer(['example.com']))
+
+        analyzer = URLAnalyzer(['other.org'])
+        instances = self._scan(analyzer, self.cache.load(analyzer.cache_settings()))
+
+        self.assertFalse(analyzer.results_changed)
+        internal = {instance.url: instance.is_internal for instance in instances}
+        self.assertEqual(internal, {"https://example.com/about": False,
+                                    "https://example.com/logo.png": False,
+                                    "https://other.org/page": True})
+
+    def test_unreadable_file_is_not_cached(self):
+        analyzer = URLAnalyzer(['example.com'])
+        read_file = analyzer._read_file_safe
+        analyzer._read_file_safe = lambda path: None if path.name == "page.html" else read_file(path)
+        self._scan_and_save(analyzer)
+        self.assertIsNone(analyzer.file_results[str(self.root / "page.html")][1])
+
+        analyzer = URLAnalyzer(['example.com'])
+        instances = self._scan(analyzer, self.cache.load(analyzer.cache_settings()))
+
+        self.assertTrue(analyzer.results_changed)
+        self.assertIn("https://example.com/logo.png", [instance.url for instance in instances])
+
+
+if __name__ == '__main__':
+    unittest.main()